@@ -0,0 +1,82 @@
+'''
+Created on Oct 19, 2026
+
+Bitwise operations, slicing and conversions on wide LogicArrays, 
+along with Logic construction.  This is run for values with only 
+0s and 1s (as read from hardware, all done on the int bitplanes) 
+and for a mix of all the states (bit by bit, through the Logic 
+operators).
+
+    python -m examples.common.bench_logic [width]
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import sys
+import time
+
+from microcotb.types.logic import Logic
+from microcotb.types.logic_array import LogicArray
+
+Width = 256
+Iterations = 200
+
+def _now_us():
+    if hasattr(time, 'ticks_us'):
+        return time.ticks_us()
+    return time.perf_counter_ns() // 1000
+
+def _elapsed_us(start):
+    if hasattr(time, 'ticks_diff'):
+        return time.ticks_diff(time.ticks_us(), start)
+    return _now_us() - start
+
+def pattern(width:int, seed:int, states:str) -> str:
+    return ''.join(states[(i*seed + seed) % len(states)] for i in range(width))
+
+def run(width:int=Width, iterations:int=Iterations, states:str='01'):
+    a_str = pattern(width, 3, states)
+    b_str = pattern(width, 7, states)
+    
+    def bitwise_and():
+        return LogicArray(a_str) & LogicArray(b_str)
+    def bitwise_or():
+        return LogicArray(a_str) | LogicArray(b_str)
+    def bitwise_xor():
+        return LogicArray(a_str) ^ LogicArray(b_str)
+    def invert():
+        return ~LogicArray(a_str)
+    def resolvable():
+        return LogicArray(a_str).is_resolvable
+    def construct():
+        return [Logic(c) for c in a_str]
+    a_array = LogicArray(a_str)
+    def slice_and_index():
+        return (a_array[width//2:1], a_array[width//3])
+    def equality():
+        return LogicArray(a_str) == LogicArray(b_str)
+    
+    benches = [
+        ('&', bitwise_and),
+        ('|', bitwise_or),
+        ('^', bitwise_xor),
+        ('~', invert),
+        ('is_resolvable', resolvable),
+        ('slice/index', slice_and_index),
+        ('==', equality),
+        ('Logic(c)', construct),
+    ]
+    print(f'{width} bits of {states}, {iterations} iterations')
+    print(f'{"op":16s} {"us/op":>10s} {"ns/bit":>10s}')
+    for name, func in benches:
+        start = _now_us()
+        for _i in range(iterations):
+            func()
+        us = _elapsed_us(start)/iterations
+        print(f'{name:16s} {us:10.1f} {1000*us/width:10.1f}')
+
+if __name__ == '__main__':
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else Width
+    run(width, states='01')
+    # a mix of everything, not just 0s and 1s
+    run(width, states='01XZ01HL01U-W')
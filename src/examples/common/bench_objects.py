@@ -0,0 +1,72 @@
+'''
+Created on Oct 19, 2026
+
+Memory taken, per instance, by the objects created at high rates
+while tests run (time values, reports, triggers...).
+
+    python -m examples.common.bench_objects
+
+On CPython this uses tracemalloc, on MicroPython gc.mem_free()
+(where __slots__ make no difference, but it's still good to know).
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import sys
+import gc
+
+from microcotb.time.value import TimeValue
+from microcotb.clock import Clock
+from microcotb.types.ioport import Port
+from microcotb.types.logic_array import LogicArray
+from microcotb.monitorable.vcd_writer import Event
+from microcotb.monitorable.state_tracking import StateChangeReport
+from microcotb.triggers import Timer, ClockCycles, RisingEdge
+from microcotb.platform import PinWrapper
+
+NumObjects = 2000
+
+def report_with_change():
+    return StateChangeReport().add_change('uo_out', 0x42)
+
+clk = PinWrapper('clk')
+Factories = [
+    ('TimeValue', lambda: TimeValue(10, 'us')),
+    ('Clock', lambda: Clock(clk, 10, 'us')),
+    ('Port', lambda: Port('p', 8)),
+    ('LogicArray', lambda: LogicArray._from_handle('01010101')),
+    ('Event', lambda: Event(None, 'uo_out', 0x42)),
+    ('StateChangeReport', report_with_change),
+    ('Timer', lambda: Timer(10, 'us')),
+    ('ClockCycles', lambda: ClockCycles(clk, 10)),
+    ('RisingEdge', lambda: RisingEdge(clk)),
+]
+
+def bytes_per_object(factory) -> float:
+    keep = []
+    if sys.implementation.name == 'micropython':
+        gc.collect()
+        free_before = gc.mem_free()
+        for _i in range(NumObjects):
+            keep.append(factory())
+        gc.collect()
+        # the list holding them is counted too, but that's small
+        return (free_before - gc.mem_free())/NumObjects
+
+    import tracemalloc
+    keep = [None]*NumObjects
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for i in range(NumObjects):
+        keep[i] = factory()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return used/NumObjects
+
+def main():
+    print(f'{"object":20s} {"bytes":>8s}')
+    for name, factory in Factories:
+        print(f'{name:20s} {bytes_per_object(factory):8.1f}')
+
+if __name__ == '__main__':
+    main()
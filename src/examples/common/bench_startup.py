@@ -0,0 +1,135 @@
+'''
+Created on Oct 19, 2026
+
+Import time and memory used, module by module.
+
+On CPython, each module is imported in a fresh interpreter, timing
+it and tracing memory with tracemalloc, and compared against the
+Budgets below.  Name modules to also get an -X importtime breakdown
+of what they pull in:
+
+    python -m examples.common.bench_startup [microcotb.dut ...]
+
+On MicroPython, modules are imported one after the other, reporting
+ticks and gc.mem_free() deltas (so each only counts what wasn't
+already loaded by those before it):
+
+    import examples.common.bench_startup as b
+    b.main()
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import sys
+import gc
+
+# in the order a testbench would typically pull them in
+Modules = [
+    'microcotb.time.value',
+    'microcotb.time.system',
+    'microcotb.clock',
+    'microcotb.platform',
+    'microcotb',
+    'microcotb.triggers',
+    'microcotb.dut',
+    'microcotb.runner',
+    'microcotb.decorators',
+    'microcotb.monitorable.dut',
+]
+
+# (ms, kB) on a desktop CPython, fresh interpreter, everything the
+# import pulls in included.  About twice what was measured when
+# these were set (with asyncio loaded, as before, microcotb.dut 
+# was ~50ms on its own).  Importing anything in microcotb means
+# importing the package, so that's the floor for all of them.
+Budgets = {
+    'microcotb.time.value': (40, 2000),
+    'microcotb.time.system': (40, 2000),
+    'microcotb.clock': (40, 2000),
+    'microcotb.platform': (40, 2000),
+    'microcotb': (40, 2000),
+    'microcotb.triggers': (40, 2000),
+    'microcotb.dut': (50, 2500),
+    'microcotb.runner': (50, 2500),
+    'microcotb.decorators': (50, 2600),
+    'microcotb.monitorable.dut': (50, 2700),
+}
+
+def _run_cpython(args:list, code:str):
+    import subprocess
+    res = subprocess.run([sys.executable] + args + ['-c', code],
+                         capture_output=True, text=True)
+    if res.returncode != 0:
+        raise RuntimeError(f'Could not run {code}: {res.stderr}')
+    return res
+
+def measure_cpython(module:str):
+    # timing and memory tracing are done separately, as 
+    # tracemalloc slows imports down quite a bit
+    res = _run_cpython([], 
+            f'import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)')
+    secs = float(res.stdout.strip().splitlines()[-1])
+    res = _run_cpython([], 
+            f'import tracemalloc; tracemalloc.start(); import {module}; print(tracemalloc.get_traced_memory()[0])')
+    mem_bytes = int(res.stdout.strip().splitlines()[-1])
+    return (secs*1000.0, mem_bytes/1024.0)
+
+def import_tree_cpython(module:str, num_entries:int=20):
+    '''
+        The most expensive imports (cumulative) pulled in by module,
+        as reported by -X importtime
+    '''
+    res = _run_cpython(['-X', 'importtime'], f'import {module}')
+    entries = []
+    for line in res.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        entries.append((int(fields[1]), int(fields[0].split(':')[-1]), fields[2].rstrip()))
+    entries.sort(reverse=True)
+    print(f'*** {module} ***')
+    print(f'{"cumul us":>10s} {"self us":>10s}  package')
+    for cumul, own, name in entries[:num_entries]:
+        print(f'{cumul:10d} {own:10d} {name}')
+
+def report_cpython() -> bool:
+    print(f'{"module":30s} {"ms":>8s} {"budget":>8s} {"kB":>8s} {"budget":>8s}')
+    all_ok = True
+    for mod in Modules:
+        ms, kb = measure_cpython(mod)
+        ms_budget, kb_budget = Budgets.get(mod, (None, None))
+        over = ''
+        if ms_budget is not None and (ms > ms_budget or kb > kb_budget):
+            over = ' OVER BUDGET'
+            all_ok = False
+        print(f'{mod:30s} {ms:8.2f} {ms_budget:8} {kb:8.1f} {kb_budget:8}{over}')
+    return all_ok
+
+def report_micropython():
+    import time
+    print(f'{"module":30s} {"ms":>8s} {"bytes":>8s} {"free":>8s}')
+    for mod in Modules:
+        gc.collect()
+        free_before = gc.mem_free()
+        t_start = time.ticks_us()
+        __import__(mod)
+        elapsed = time.ticks_diff(time.ticks_us(), t_start)
+        gc.collect()
+        free_after = gc.mem_free()
+        print(f'{mod:30s} {elapsed/1000:8.2f} {free_before - free_after:8d} {free_after:8d}')
+
+def main():
+    if sys.implementation.name == 'micropython':
+        report_micropython()
+        return True
+    ok = report_cpython()
+    if len(sys.argv) > 1:
+        # detail for named modules
+        for mod in sys.argv[1:]:
+            import_tree_cpython(mod)
+    return ok
+
+if __name__ == '__main__':
+    if not main():
+        sys.exit(1)
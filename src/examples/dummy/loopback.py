@@ -8,6 +8,7 @@ Created on Nov 26, 2024
 from microcotb.dut import DUT
 from microcotb.platform.dummy import PinWrapper
 from microcotb.ports.io import IO
+from microcotb.time.system import SystemTime
 
 class FakePinWithCallback(PinWrapper):
     '''
@@ -23,6 +24,7 @@ class FakePinWithCallback(PinWrapper):
         return self._value
     @value.setter 
     def value(self, set_to:int):
+        SystemTime.before_pin_write()
         self._value = set_to
         self._cb()
 
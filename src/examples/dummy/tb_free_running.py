@@ -0,0 +1,89 @@
+'''
+Created on Oct 19, 2026
+
+Checks that free-running clocks (generated by the emulated 
+PIOClockGenerator, with time moved forward arithmetically) wake 
+background tasks exactly when stepping through every half period 
+does.
+
+    python -m examples.dummy.tb_free_running
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+
+import microcotb as cocotb
+
+from microcotb.clock import Clock
+from microcotb.triggers import ClockCycles, Timer, RisingEdge, FallingEdge
+from microcotb.utils import get_sim_time
+from microcotb.platform.dummy.pio_clock import PIOClockGenerator
+
+cocotb.set_runner_scope(__name__)
+
+# wake times, relative to the start of each run, by run type
+WakeTimes = dict()
+
+async def timer_waiter(log:list, delay_us:int):
+    for _i in range(5):
+        await Timer(delay_us, 'us')
+        log.append(('timer', delay_us, get_sim_time('us')))
+
+async def edge_waiter(dut, log:list):
+    for _i in range(3):
+        await RisingEdge(dut.clk)
+        log.append(('rising', int(dut.clk.value), get_sim_time('us')))
+        await FallingEdge(dut.clk)
+        log.append(('falling', int(dut.clk.value), get_sim_time('us')))
+
+async def cycles_waiter(dut, log:list):
+    for _i in range(3):
+        await ClockCycles(dut.clk, 2)
+        log.append(('cycles', int(dut.clk.value), get_sim_time('us')))
+
+async def record_wakes(dut, free_running:bool):
+    clock = Clock(dut.clk, 10, units="us")
+    if free_running:
+        clock.use_generator(PIOClockGenerator(dut.clk))
+    cocotb.start_soon(clock.start())
+    
+    log = []
+    t_start = get_sim_time('us')
+    cocotb.start_soon(timer_waiter(log, 7))
+    cocotb.start_soon(timer_waiter(log, 12))
+    cocotb.start_soon(edge_waiter(dut, log))
+    cocotb.start_soon(cycles_waiter(dut, log))
+    await Timer(100, 'us')
+    await ClockCycles(dut.clk, 3)
+    log.append(('main', int(dut.clk.value), get_sim_time('us')))
+    WakeTimes[free_running] = list(map(lambda e: (e[0], e[1], e[2] - t_start), log))
+    
+
+@cocotb.test()
+async def test_stepped(dut):
+    await record_wakes(dut, False)
+
+@cocotb.test()
+async def test_free_running(dut):
+    await record_wakes(dut, True)
+    
+@cocotb.test()
+async def test_same_wake_times(dut):
+    stepped = WakeTimes.get(False)
+    free = WakeTimes.get(True)
+    assert stepped is not None and free is not None, "Both runs need to have happened"
+    for s, f in zip(stepped, free):
+        assert s == f, f"stepped woke {s}, free-running {f}"
+    assert len(stepped) == len(free), f"{len(stepped)} wakes stepped, {len(free)} free-running"
+    
+    
+def main():
+    import microcotb.log as logging
+    logging.basicConfig(level=logging.INFO) 
+    from examples.dummy.loopback import LoopBackCounter
+    dut = LoopBackCounter('freerun')
+    runner = cocotb.get_runner(__name__)
+    runner.test(dut)
+
+if __name__ == '__main__':
+    main()
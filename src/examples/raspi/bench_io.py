@@ -0,0 +1,76 @@
+'''
+Created on Oct 19, 2026
+
+Timing of the RPi port read/write paths, using the fake gpiod so
+it runs anywhere.  The fake's own cost is included, so this is
+mostly useful for comparisons.
+
+Batching (DUT.batch_step_io) saves gpiod calls, but reads all the 
+lines on the chip and adds some bookkeeping, so against the fake 
+it comes out slower than unbatched access.  Whether fewer calls
+pay off on an actual Pi is to be measured there, with this.
+
+    python -m examples.raspi.bench_io
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import time
+import examples.raspi.fake_gpiod as fake_gpiod
+fake_gpiod.install()
+
+from microcotb_rpi import DUT, Direction
+from microcotb.time.system import SystemTime
+
+NumIterations = 20000
+
+UIPins = [3, 4, 15, 17, 2, 14, 18, 27]
+UOPins = [0, 6, 13, 26, 5, 12, 19, 20]
+UIOPins = [24, 9, 11, 1, 10, 25, 8, 7]
+
+def getDUT() -> DUT:
+    chip = fake_gpiod.chip()
+    for a, b in zip(UIPins, UOPins):
+        chip.connect(a, b)
+    dut = DUT('bench')
+    dut.add_rpio('ui_in', Direction.OUTPUT, UIPins)
+    dut.add_rpio('uio', Direction.CONFIGURABLE, UIOPins)
+    dut.add_rpio('uo_out', Direction.INPUT, UOPins)
+    dut.uio_oe.value = 0x0f # half outputs
+    return dut
+
+def timeit(label:str, fn, num:int=NumIterations):
+    chip = fake_gpiod.chip()
+    chip.reset_counts()
+    tstart = time.perf_counter()
+    for i in range(num):
+        fn(i)
+    elapsed = time.perf_counter() - tstart
+    print(f'{label:32s} {elapsed/num*1e6:8.2f}us/op   ({chip.get_calls} gets, {chip.set_calls} sets)')
+
+def main():
+    dut = getDUT()
+    ui_in = dut.ui_in.port
+    uio = dut.uio.port
+    uo_out = dut.uo_out.port
+
+    print(f'*** Raw port signal access, {NumIterations} iterations ***')
+    timeit('read uo_out', lambda i: uo_out.signal_read())
+    timeit('write ui_in', lambda i: ui_in.signal_write(i & 0xff))
+    timeit('write uio (partial outputs)', lambda i: uio.signal_write(i & 0xff))
+
+    def step(i:int):
+        ui_in.do_write(i & 0xff)
+        uio.do_write(i & 0xff)
+        uo_out.do_read()
+        uio.do_read()
+        SystemTime.advance(1, 'ns')
+
+    print(f'*** Steps with 2 writes and 2 reads ***')
+    timeit('unbatched', step)
+    for bank in dut.line_banks:
+        bank.batching = True
+    timeit('batched', step)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,227 @@
+'''
+Created on Oct 19, 2026
+
+A stand-in for the (v2) gpiod module, enough to run the RPi DUT
+on a desktop.  Install it before importing microcotb_rpi
+
+    import examples.raspi.fake_gpiod as fake_gpiod
+    fake_gpiod.install()
+    from microcotb_rpi import *
+
+Each chip is just a dict of line levels.  Outputs land there when
+written, inputs may be driven with
+
+    fake_gpiod.chip('/dev/gpiochip0').drive(offset, 1)
+
+which also queues edge events, as appropriate.  Lines may be
+wired together with connect(), so an output drives an input.
+
+Calls to get/set values are counted, to see how many trips to
+the kernel things would take.
+
+Each request has a real file descriptor (a pipe) that becomes 
+readable when events are waiting, so it may be select()ed/poll()ed
+like the real thing.
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import os
+import sys
+import threading
+import time
+import types
+from enum import Enum
+
+class Direction(Enum):
+    AS_IS = 1
+    INPUT = 2
+    OUTPUT = 3
+
+class Value(Enum):
+    INACTIVE = 0
+    ACTIVE = 1
+
+class Edge(Enum):
+    NONE = 1
+    RISING = 2
+    FALLING = 3
+    BOTH = 4
+
+class EdgeEvent:
+    class Type(Enum):
+        RISING_EDGE = 1
+        FALLING_EDGE = 2
+
+    def __init__(self, event_type, timestamp_ns:int, line_offset:int,
+                 global_seqno:int, line_seqno:int):
+        self.event_type = event_type
+        self.timestamp_ns = timestamp_ns
+        self.line_offset = line_offset
+        self.global_seqno = global_seqno
+        self.line_seqno = line_seqno
+
+    def __repr__(self):
+        return f'<EdgeEvent {self.event_type.name} line {self.line_offset} @ {self.timestamp_ns}>'
+
+class LineSettings:
+    def __init__(self, direction=Direction.AS_IS, edge_detection=Edge.NONE,
+                 debounce_period=None, output_value=Value.INACTIVE, **kwargs):
+        self.direction = direction
+        self.edge_detection = edge_detection
+        self.debounce_period = debounce_period
+        self.output_value = output_value
+
+    def __repr__(self):
+        return f'<LineSettings {self.direction.name}>'
+
+
+class FakeChip:
+    def __init__(self, path:str):
+        self.path = path
+        self.levels = dict()
+        self.settings = dict()
+        self.connections = dict()
+        self.get_calls = 0
+        self.set_calls = 0
+        self.request_calls = 0
+        self._requests = []
+        self._seqno = 0
+
+    def connect(self, output_offset:int, input_offset:int):
+        self.connections.setdefault(output_offset, []).append(input_offset)
+
+    def drive(self, offset:int, level:int):
+        level = 1 if level else 0
+        old = self.levels.get(offset, 0)
+        self.levels[offset] = level
+        if old != level:
+            self._edge(offset, level)
+        for other in self.connections.get(offset, []):
+            self.drive(other, level)
+
+    def _edge(self, offset:int, level:int):
+        settings = self.settings.get(offset)
+        if settings is None or settings.direction != Direction.INPUT:
+            return
+        wanted = Edge.RISING if level else Edge.FALLING
+        if settings.edge_detection not in (Edge.BOTH, wanted):
+            return
+        self._seqno += 1
+        evtype = EdgeEvent.Type.RISING_EDGE if level else EdgeEvent.Type.FALLING_EDGE
+        for req in self._requests:
+            if offset in req.offsets:
+                req.queue_event(EdgeEvent(evtype, time.monotonic_ns(), offset,
+                                          self._seqno, self._seqno))
+
+    def reset_counts(self):
+        self.get_calls = 0
+        self.set_calls = 0
+        self.request_calls = 0
+
+
+class LineRequest:
+    def __init__(self, chip:FakeChip, config:dict):
+        self.chip = chip
+        self.offsets = []
+        self.events = []
+        self.released = False
+        self._lock = threading.Lock()
+        self._fd_r, self._fd_w = os.pipe()
+        chip._requests.append(self)
+        self.reconfigure_lines(config, adding=True)
+
+    def _config_items(self, config:dict):
+        for k, settings in config.items():
+            if isinstance(k, tuple):
+                for offset in k:
+                    yield offset, settings
+            else:
+                yield k, settings
+
+    def reconfigure_lines(self, config:dict, adding:bool=False):
+        for offset, settings in self._config_items(config):
+            if offset not in self.offsets:
+                if not adding:
+                    raise ValueError(f'line {offset} not in request')
+                self.offsets.append(offset)
+            self.chip.settings[offset] = settings
+            if settings.direction == Direction.OUTPUT and settings.output_value is not None:
+                self.chip.drive(offset, settings.output_value.value)
+
+    def get_values(self, lines=None):
+        self.chip.get_calls += 1
+        if lines is None:
+            lines = self.offsets
+        return list(map(lambda o: Value.ACTIVE if self.chip.levels.get(o, 0) else Value.INACTIVE, lines))
+
+    def set_values(self, values:dict):
+        self.chip.set_calls += 1
+        for offset, v in values.items():
+            settings = self.chip.settings.get(offset)
+            if settings is None or settings.direction != Direction.OUTPUT:
+                raise ValueError(f'line {offset} is not an output')
+            self.chip.drive(offset, v.value)
+
+    @property
+    def fd(self) -> int:
+        return self._fd_r
+
+    def queue_event(self, evt:EdgeEvent):
+        with self._lock:
+            if not len(self.events):
+                os.write(self._fd_w, b'e')
+            self.events.append(evt)
+
+    def wait_edge_events(self, timeout=None) -> bool:
+        return len(self.events) > 0
+
+    def read_edge_events(self, max_events:int=None):
+        with self._lock:
+            evts = self.events
+            self.events = []
+            if len(evts):
+                os.read(self._fd_r, 1)
+        return evts
+
+    def release(self):
+        if self.released:
+            return
+        self.released = True
+        if self in self.chip._requests:
+            self.chip._requests.remove(self)
+        os.close(self._fd_r)
+        os.close(self._fd_w)
+
+
+_Chips = dict()
+def chip(path:str='/dev/gpiochip0') -> FakeChip:
+    if path not in _Chips:
+        _Chips[path] = FakeChip(path)
+    return _Chips[path]
+
+def request_lines(path:str, consumer:str=None, config:dict=None, **kwargs) -> LineRequest:
+    c = chip(path)
+    c.request_calls += 1
+    return LineRequest(c, config if config is not None else dict())
+
+def install():
+    '''
+        Register this as the gpiod module (and its line/edge_event submodules).
+    '''
+    me = sys.modules[__name__]
+    gpiod = types.ModuleType('gpiod')
+    for nm in ['LineSettings', 'LineRequest', 'request_lines', 'chip', 'EdgeEvent']:
+        setattr(gpiod, nm, getattr(me, nm))
+    line = types.ModuleType('gpiod.line')
+    line.Direction = Direction
+    line.Value = Value
+    line.Edge = Edge
+    edge_event = types.ModuleType('gpiod.edge_event')
+    edge_event.EdgeEvent = EdgeEvent
+    gpiod.line = line
+    gpiod.edge_event = edge_event
+    sys.modules['gpiod'] = gpiod
+    sys.modules['gpiod.line'] = line
+    sys.modules['gpiod.edge_event'] = edge_event
+    return gpiod
@@ -1,4 +1,3 @@
-
 '''
 Created on Jan 23, 2024
 
@@ -6,9 +5,8 @@ Created on Jan 23, 2024
 @copyright: Copyright (C) 2024 Pat Deegan, https://psychogenic.com
 '''
 
-import machine
-import examples.rp2040.lowlevel_io as lowlevel
 import microcotb.dut 
+from microcotb.platform import SIOPort, SIOPin
 # from examples.rp2040.factory_test import *
 
 class TinyTapeoutDUT(microcotb.dut.DUT):
@@ -16,45 +14,37 @@ class TinyTapeoutDUT(microcotb.dut.DUT):
         super().__init__(name)
         
         # configuration for all 
-        # the I/O in the TT ASICs
-        # low-level read/write functions
-        # in their own module
+        # the I/O in the TT ASICs, 
+        # as GPIOs (LSB first) accessed through 
+        # the SIO registers (see also lowlevel_io.py, 
+        # for the hand-written equivalent)
+        self.ui_in_gpios = SIOPort([9, 10, 11, 12, 17, 18, 19, 20], output=True)
+        self.uo_out_gpios = SIOPort([5, 6, 7, 8, 13, 14, 15, 16])
+        self.uio_gpios = SIOPort(list(range(21, 29)))
         ports = [
-              ('uo_out',  8, lowlevel.read_uo_out_byte, None),
-              ('ui_in',   8, lowlevel.read_ui_in_byte, 
-                               lowlevel.write_ui_in_byte),
-              ('uio_in',  8, lowlevel.read_uio_byte, 
-                                lowlevel.write_uio_byte),
-              ('uio_out', 8, lowlevel.read_uio_byte, None),
-              ('uio_oe',  8, lowlevel.read_uio_outputenable, 
-                                 lowlevel.write_uio_outputenable)
+              ('uo_out',  8, self.uo_out_gpios.read, None),
+              ('ui_in',   8, self.ui_in_gpios.read, 
+                               self.ui_in_gpios.write),
+              ('uio_in',  8, self.uio_gpios.read, 
+                                self.uio_gpios.write),
+              ('uio_out', 8, self.uio_gpios.read, None),
+              ('uio_oe',  8, self.uio_gpios.read_oe, 
+                                 self.uio_gpios.write_oe)
         ]
         
         # now add a port for each configuration
         for p in ports:
             self.add_port( *p )
         
-        # also need clk and reset
-        self.clk = PinWrapper('clk', 
-                              machine.Pin(0, machine.Pin.OUT))
-        self.rst_n = PinWrapper('rst_n', machine.Pin(1, machine.Pin.OUT))
+        # bit and slice writes, like dut.ui_in[3] = 1, only touch 
+        # the bits concerned
+        self.ui_in.signal_set_bits = self.ui_in_gpios.set_bits
+        self.uio_in.signal_set_bits = self.uio_gpios.set_bits
+        
+        # also need clk and reset: the clock toggles 
+        # with a single register write
+        self.clk = SIOPin('clk', 0)
+        self.rst_n = SIOPin('rst_n', 1)
         # ena may be used in existing tests, does nothing
         self.ena = microcotb.dut.NoopSignal('ena', 1)
         # yep, that's it
-
-class PinWrapper(microcotb.dut.PinWrapper):
-    def __init__(self, name:str, pin):
-        super().__init__(name, pin)
-        
-    @property 
-    def value(self):
-        return self._pin.value()
-    
-    @value.setter 
-    def value(self, set_to:int):
-        self._pin.value(set_to)
-            
-
-
-    
-    
\ No newline at end of file
@@ -0,0 +1,13 @@
+# MicroPython manifest, to freeze microcotb into the firmware.
+# 
+# Frozen modules are imported straight from flash: no compiling 
+# at import time and their bytecode doesn't take up any heap, which 
+# makes a big difference on the RP2040.  Build with
+# 
+#   make -C ports/rp2 BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/microcotb/src/manifest.py
+# 
+# examples.common.bench_startup shows what importing costs, frozen or not.
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+package("microcotb", opt=3)
@@ -1,14 +1,33 @@
-from .runner import Runner
-from .decorators import test, parametrize
 from microcotb.platform import Features
-import os
+from microcotb.scheduler import Scheduler, Task
 
 RunnerModuleName = None
 
 __version__ = "0.7.6"
 
-def start_soon(c):
-    pass
+# loaded on first use, so that importing microcotb (e.g. just for
+# a DUT) doesn't drag in the runner and everything it needs
+_LazyAttributes = {
+    'Runner': ('microcotb.runner', 'Runner'),
+    'test': ('microcotb.decorators', 'test'),
+    'parametrize': ('microcotb.decorators', 'parametrize'),
+}
+
+def __getattr__(name:str):
+    if name not in _LazyAttributes:
+        raise AttributeError(name)
+    modname, attr = _LazyAttributes[name]
+    mod = __import__(modname, None, None, [attr])
+    val = getattr(mod, attr)
+    globals()[name] = val
+    return val
+
+def start_soon(c) -> Task:
+    '''
+        Run coroutine c in the background, alongside the test.
+        Returns a Task, which may be awaited or cancel()ed.
+    '''
+    return Scheduler.start_soon(c)
 
 def set_runner_scope(scope:str):
     global RunnerModuleName
@@ -21,6 +40,7 @@ def get_runner_scope():
 def get_runner(module_name:str=None, sim=None):
     if module_name is None:
         module_name = get_caller_file(2)
+    from microcotb.runner import Runner
     return Runner.get(module_name)
 
 def get_caller_except(msg:str='boink'):
@@ -44,6 +64,7 @@ def get_caller_file(back_levels:int=1):
         for _i in range(back_levels):
             frame = frame.f_back 
         
+        import os
         fname =  os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
         return fname
         
@@ -4,9 +4,7 @@ Created on Nov 21, 2024
 @author: Pat Deegan
 @copyright: Copyright (C) 2024 Pat Deegan, https://psychogenic.com
 '''
-import gc 
 from microcotb.time import TimeValue
-gc.collect()
 
 _ClockForSignal = dict()     
 class Clock:
@@ -31,6 +29,21 @@ class Clock:
             return fastest.half_period
         return None
     
+    @classmethod 
+    def all_run_free(cls) -> bool:
+        '''
+            True if there are clocks and they're all generated by 
+            hardware, so time may be moved forward in one go rather 
+            than stepping through every half period.
+        '''
+        global _ClockForSignal
+        if not len(_ClockForSignal):
+            return False
+        for clk in _ClockForSignal.values():
+            if clk._generator is None:
+                return False
+        return True
+    
     @classmethod
     def clear_all(cls):
         global _ClockForSignal
@@ -45,9 +58,16 @@ class Clock:
         
         return sorted(vals, key=lambda x: float(x.half_period))
     
+    __slots__ = ('signal', 'running', '_fast_toggle', '_generator', 'half_period', 
+                 'next_toggle', 'current_signal_value', '_toggle_count', '_period')
+    
     def __init__(self, signal, period, units):
         self.signal = signal
         self.running = False
+        # signals that can flip themselves (e.g. SIOPin) do so 
+        # without our having to write a value
+        self._fast_toggle = getattr(signal, 'fast_toggle', None)
+        self._generator = None
         
         half_period = TimeValue(period/2, units)
         
@@ -89,9 +109,33 @@ class Clock:
     def event_interval(self):
         return self.half_period
     
+    @property 
+    def generator(self):
+        return self._generator
+    
+    @property 
+    def runs_free(self) -> bool:
+        return self._generator is not None
+    
+    def use_generator(self, generator):
+        '''
+            Have hardware (e.g. a PIOClockGenerator from the platform)
+            produce the clock edges: any number of due toggles then 
+            happen in a single run_transitions() call.
+        '''
+        self._generator = generator
+        if generator is not None:
+            generator.set_level(self.current_signal_value)
+        return self
+        
     def start(self):
         global _ClockForSignal
         _ClockForSignal[self.signal] = self
+        if self._generator is not None:
+            self._generator.set_level(self.current_signal_value)
+        elif self._fast_toggle is not None:
+            # toggles are relative, so start out in sync
+            self.signal.value = self.current_signal_value
         
     def num_events_in(self, time_or_timevalue:int, units:str=None):
         if isinstance(time_or_timevalue, TimeValue):
@@ -103,6 +147,8 @@ class Clock:
         return tv / self.half_period
     
     def time_is_now(self, currentTime:TimeValue) -> bool:
+        if self._generator is not None:
+            return self._generate_until(currentTime)
         did_clock = False
         while self.next_toggle < currentTime:
             self.toggle()
@@ -112,12 +158,34 @@ class Clock:
             
         return did_clock
         
+    def _generate_until(self, currentTime:TimeValue) -> bool:
+        # same as toggling while next_toggle < currentTime, but 
+        # worked out in one go
+        gap = currentTime._t_baseunits - self.next_toggle._t_baseunits
+        if gap <= 0:
+            return False
+        hp = self.half_period._t_baseunits
+        num_toggles = int((gap - 1)//hp) + 1 if hp > 0 else 1
+        self._generator.run_transitions(num_toggles)
+        if num_toggles & 1:
+            self.current_signal_value = 1 if not self.current_signal_value else 0
+        self.next_toggle += self.half_period * num_toggles
+        return True
+        
     def time_has_passed(self):
         #print(f"time passed to {SystemTime.current()} next is {self.next_toggle}")
         from microcotb.time.system import SystemTime
         self.time_is_now(SystemTime.current())
     
     def toggle(self):
+        if self._generator is not None:
+            self._generator.run_transitions(1)
+            self.current_signal_value ^= 1
+            return
+        if self._fast_toggle is not None:
+            self._fast_toggle()
+            self.current_signal_value ^= 1
+            return
         new_val = 1 if not self.current_signal_value else 0
         self.signal.value = new_val 
         self.current_signal_value = new_val
@@ -9,16 +9,104 @@ import microcotb.log as logging
 from microcotb.testcase import TestCase
 
 from microcotb.sub_signals import SliceWrapper
+from microcotb.snapshot import Snapshot
+from microcotb.time.system import SystemTime
 
 # import these here so users don't need to go 
 # hunting for them in the lib
 from microcotb.platform import PinWrapper
 from microcotb.sub_signals import NoopSignal, Wire
+from microcotb.types.ioport import WritePolicy
 
 
 class IOInterface:
     def __init__(self):
+        # registry of signals, filled in as they're set as attributes:
+        # by attribute name, for __setattr__, and by signal name, 
+        # for all of them and for actual ports (IO, not aliases)
+        self._signal_attribs = dict()
         self._avail_io = dict()
+        self._avail_ports = dict()
+        self._cache_reads = False
+        self._write_policy = None
+        self._adaptive_debounce = False
+    
+    @property 
+    def cache_reads(self) -> bool:
+        '''
+            When enabled, ports only go to the hardware on the first read 
+            in a given step--repeated reads are served from a cache until 
+            time advances or anything is written to the DUT.
+        '''
+        return self._cache_reads
+    
+    @cache_reads.setter 
+    def cache_reads(self, set_to:bool):
+        self._cache_reads = True if set_to else False
+        for io in self.available_ports():
+            io.port.cache_reads = self._cache_reads
+            
+    @property 
+    def write_policy(self) -> int:
+        '''
+            The WritePolicy applied to all ports, None if they've been left
+            to their own (default) settings.
+        '''
+        return self._write_policy
+    
+    @write_policy.setter 
+    def write_policy(self, set_to:int):
+        self._write_policy = set_to
+        for io in self.available_ports():
+            io.port.write_policy = set_to
+            
+    @property 
+    def hardware_writes_saved(self) -> int:
+        '''
+            Number of writes that never had to go out to the hardware,
+            because of the write_policy.
+        '''
+        return sum(map(lambda io: io.port.writes_saved, self.available_ports()))
+    
+    def flush_writes(self):
+        SystemTime.flush_deferred_writes()
+        
+    @property 
+    def read_cache_hits(self) -> int:
+        '''
+            Total number of reads served from the cache (see cache_reads), 
+            per-port counts are in io.port.cache_hits
+        '''
+        return sum(map(lambda io: io.port.cache_hits, self.available_ports()))
+    
+    @property 
+    def adaptive_debounce(self) -> bool:
+        '''
+            When enabled, every port debounces its reads as needed,
+            scaling up when values disagree and back down when 
+            they're clean (see ioport.Debouncer).
+        '''
+        return self._adaptive_debounce
+    
+    @adaptive_debounce.setter 
+    def adaptive_debounce(self, set_to:bool):
+        self._adaptive_debounce = True if set_to else False
+        for io in self.available_ports():
+            io.port.adaptive_debounce = self._adaptive_debounce
+            
+    def debounce_stats(self, noisy_only:bool=False) -> dict:
+        '''
+            Debouncing statistics, by port name, for ports that have 
+            been read (or only those that have actually seen some 
+            disagreement, with noisy_only).
+        '''
+        stats = dict()
+        for io in self.available_ports():
+            st = io.port.debounce_stats
+            if not st['reads'] or (noisy_only and not st['disagreements']):
+                continue
+            stats[io.name] = st
+        return stats
     
     @classmethod
     def new_slice_attribute(cls, name:str, source:IO, idx_or_start:int, slice_end:int=None):
@@ -45,17 +133,9 @@ class IOInterface:
             io.value = initial_value
     
     def available_io(self, types_of_interest=None):
-        # get anything that's IO or IO-based/derived
-        if self._avail_io is None or not len(self._avail_io):
-            self._avail_io = dict()
-            # do a search
-            attrs = \
-                list(filter(lambda x: isinstance(x, (IO, SliceWrapper)), 
-                               map(lambda a: getattr(self, a), 
-                                   filter(lambda g: not g.startswith('_'), 
-                                          sorted(dir(self))))))
-            for at in attrs:
-                self._avail_io[at.name] = at
+        '''
+            Every IO or IO-based/derived signal (ports and slice/bit aliases)
+        '''
         if types_of_interest is None:
             return list(self._avail_io.values())
         
@@ -66,22 +146,35 @@ class IOInterface:
             Available IO source ports, ie. IO objects, not 
             slice/bit aliasing
         '''
-        return self.available_io((IO,))
+        return list(self._avail_ports.values())
+    
+    def _register_signal(self, name:str, value):
+        if isinstance(value, IO):
+            if self._cache_reads:
+                value.port.cache_reads = True
+            if self._write_policy is not None:
+                value.port.write_policy = self._write_policy
+            if self._adaptive_debounce:
+                value.port.adaptive_debounce = True
+        
+        self._signal_attribs[name] = value
+        if value.name not in self._avail_io:
+            self._avail_io[value.name] = value
+            if isinstance(value, IO):
+                self._avail_ports[value.name] = value
+        elif getattr(self, '_log', None) is not None:
+            self._log.debug(f"already have a signal named {value.name}")
     
     def __setattr__(self, name:str, value):
-        if hasattr(self, name):
-            port = getattr(self, name)
-            if isinstance(port, (IO, SliceWrapper)):
-                port.value = value 
+        # signals are only ever set once, after that 
+        # setting the attribute sets their value
+        signals = getattr(self, '_signal_attribs', None)
+        if signals is not None:
+            if name in signals:
+                signals[name].value = value
                 return
-        elif isinstance(value, (IO, SliceWrapper)):
-            # don't know this yet, and it's IO
-            print(value.name)
-            if hasattr(self, '_avail_io'):
-                if value.name not in self._avail_io:
-                    self._avail_io[value.name] = value
-                else:
-                    print(f"ALREADY HAS A {value.name}")
+            if isinstance(value, (IO, SliceWrapper)):
+                self._register_signal(name, value)
         
         super().__setattr__(name, value)
         
@@ -110,6 +203,37 @@ class DUT(IOInterface):
         # override if desired
         pass
     
+    def read_all(self) -> dict:
+        '''
+            Read every readable port, returning a dict of name: int value.
+            This does one read per port, override in implementations that 
+            can get everything from the hardware in a single transaction.
+        '''
+        vals = dict()
+        for io in self.available_ports():
+            if io.is_readable:
+                vals[io.name] = io.port.do_read()
+        return vals
+    
+    def snapshot(self, serve_reads:bool=False) -> Snapshot:
+        '''
+            Get the state of all readable signals at once.
+            @param serve_reads: if True, reads of these ports will be
+            served from the snapshot until time advances or 
+            something is written to the DUT.
+        '''
+        vals = self.read_all()
+        if serve_reads:
+            for io in self.available_ports():
+                if io.name in vals:
+                    io.port.hold_for_step(vals[io.name])
+                    
+        slices = dict()
+        for slc in self.available_io((SliceWrapper,)):
+            if slc._io.name in vals:
+                slices[slc.name] = slc
+        return Snapshot(SystemTime.current().clone(), vals, slices)
+    
         
         
     
@@ -164,20 +164,19 @@ class MonitorableDUT(microcotb.dut.DUT):
             if name in self._sub_fields:
                 #last_val = getattr(self, name).last_value_as_array
                 #print(last_val)
-                v = report.get(name)
-                io = getattr(self, name)
-                bin_str = io.port.value_as_array(v)
-                
+                v = int(report.get(name))
                 for sf in self._sub_fields[name]:
-                    cur_v = int(sf.out_of_array(bin_str))
+                    cur_v = sf.bits_from(v)
                     if not self.state_cache.has(sf.name)\
                         or self.state_cache.get(sf.name) != cur_v:
                         self.state_cache.set(sf.name, cur_v)
                         report.add_change(sf.name, cur_v)
                     
     
-    def append_state_change(self, stch:StateChangeReport):
-        self.add_subfields_and_queue_state_change(SystemTime.current().clone(), stch)
+    def append_state_change(self, stch:StateChangeReport, at_time:TimeValue=None):
+        if at_time is None:
+            at_time = SystemTime.current().clone()
+        self.add_subfields_and_queue_state_change(at_time, stch)
         self.trigger_all_state_callbacks(stch)
         
     def trigger_all_state_callbacks(self, stch:StateChangeReport):
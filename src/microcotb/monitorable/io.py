@@ -6,14 +6,21 @@ Created on Dec 7, 2024
 '''
 from microcotb.ports.io import IO
 class MonitorableIO(IO):
+    '''
+        IO that can report every read and write to callbacks.
+        
+        The port is only given the wrapped, notifying, functions while 
+        a callback is actually set; otherwise it has the original
+        read/write functions, so unmonitored access costs exactly 
+        what it does for a plain IO.
+    '''
     
     def __init__(self, name:str, width:int, read_signal_fn=None, write_signal_fn=None):
-        super().__init__(name, width, 
-                         self.wrapped_signal_read if read_signal_fn is not None else None,
-                         self.wrapped_signal_write if write_signal_fn is not None else None)
+        super().__init__(name, width, read_signal_fn, write_signal_fn)
         
         self._orig_signal_read_fn = read_signal_fn
         self._orig_signal_write_fn = write_signal_fn
+        self._orig_signal_set_bits_fn = None
         
         
         self._write_notif_callback = None
@@ -22,21 +29,32 @@ class MonitorableIO(IO):
     
     @property
     def signal_read(self):
-        return self.wrapped_signal_read
+        return self.port.signal_read
     
     @signal_read.setter 
     def signal_read(self, set_to):
-        self.port.signal_read = set_to 
+        self._orig_signal_read_fn = set_to
+        self._update_read_dispatch()
         
         
     @property
     def signal_write(self):
-        return self.wrapped_signal_write
+        return self.port.signal_write
     
     @signal_write.setter 
     def signal_write(self, set_to):
-        self.port.signal_write = set_to 
+        self._orig_signal_write_fn = set_to
+        self._update_write_dispatch()
+    
+        
+    @property
+    def signal_set_bits(self):
+        return self.port.signal_set_bits
     
+    @signal_set_bits.setter 
+    def signal_set_bits(self, set_to):
+        self._orig_signal_set_bits_fn = set_to
+        self._update_write_dispatch()
         
     @property 
     def read_notifications_to(self):
@@ -45,6 +63,7 @@ class MonitorableIO(IO):
     @read_notifications_to.setter 
     def read_notifications_to(self, cb):
         self._read_notif_callback = cb
+        self._update_read_dispatch()
         
     @property 
     def write_notifications_to(self):
@@ -53,11 +72,28 @@ class MonitorableIO(IO):
     @write_notifications_to.setter 
     def write_notifications_to(self, cb):
         self._write_notif_callback = cb
+        self._update_write_dispatch()
         
+    def _update_read_dispatch(self):
+        if self._read_notif_callback is None or self._orig_signal_read_fn is None:
+            self.port.signal_read = self._orig_signal_read_fn
+        else:
+            self.port.signal_read = self.wrapped_signal_read
+            
+    def _update_write_dispatch(self):
+        if self._write_notif_callback is None or self._orig_signal_write_fn is None:
+            self.port.signal_write = self._orig_signal_write_fn
+            self.port.signal_set_bits = self._orig_signal_set_bits_fn
+        else:
+            self.port.signal_write = self.wrapped_signal_write
+            if self._orig_signal_set_bits_fn is None:
+                self.port.signal_set_bits = None
+            else:
+                self.port.signal_set_bits = self.wrapped_signal_set_bits
         
     def wrapped_signal_read(self):
         v = self._orig_signal_read_fn()
-        cb = self.read_notifications_to
+        cb = self._read_notif_callback
         if cb is not None:
             # print("Calling rd notif")
             cb(self, v)
@@ -65,8 +101,15 @@ class MonitorableIO(IO):
             
     def wrapped_signal_write(self, val):
         ret = self._orig_signal_write_fn(val)
-        cb = self.write_notifications_to
+        cb = self._write_notif_callback
         if cb is not None:
             #print("Calling wr notif")
             cb(self, val)
-        return ret 
\ No newline at end of file
+        return ret
+    
+    def wrapped_signal_set_bits(self, mask, val):
+        ret = self._orig_signal_set_bits_fn(mask, val)
+        cb = self._write_notif_callback
+        if cb is not None:
+            cb(self, val)
+        return ret
@@ -8,7 +8,12 @@ Created on Dec 7, 2024
 class StateChangeReport:
     '''
         Base interface for a State Change Report.
+        
+        Values are available as attributes, e.g. report.uo_out, 
+        for any name that isn't one of the methods.
     '''
+    __slots__ = ('_changed_ports', '_num_changes')
+    
     def __init__(self):
         self._changed_ports = dict()
         self._num_changes = 0
@@ -40,9 +45,18 @@ class StateChangeReport:
             used internally to add a new changed value.
         '''
         self._changed_ports[pname] = pvalue
-        setattr(self, pname, pvalue)
         self._num_changes += 1
         return self
+    
+    def __getattr__(self, name:str):
+        # only gets here for names that aren't real attributes
+        if name[0] == '_':
+            raise AttributeError(name)
+        try:
+            return self._changed_ports[name]
+        except KeyError:
+            raise AttributeError(name)
+        
     def __len__(self):
         return len(self._changed_ports)
     def __repr__(self):
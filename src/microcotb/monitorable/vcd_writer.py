@@ -18,6 +18,8 @@ class Event:
     @classmethod 
     def variables_with_events(cls):
         return list(cls.VariablesWithEvents.keys())
+    
+    __slots__ = ('ts', 'var_name', 'value')
         
     def __init__(self, ts:TimeValue, var_name:str, new_value:int):
         self.ts = ts 
@@ -1,3 +1,5 @@
 from .pin import PinWrapper
+from .sio import SIOPort, SIOPin
+from .pio_clock import PIOClockGenerator
 def exception_as_str(e:Exception):
     return str(e)
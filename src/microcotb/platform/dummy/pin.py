@@ -5,6 +5,7 @@ Created on Nov 26, 2024
 @copyright: Copyright (C) 2024 Pat Deegan, https://psychogenic.com
 '''
 from microcotb.types.with_value import WithValue
+from microcotb.time.system import SystemTime
 
 class PinWrapper(WithValue):
     def __init__(self, name:str, pin=None):
@@ -14,6 +15,16 @@ class PinWrapper(WithValue):
         
     def __hash__(self)->int:
         return hash(self._name)
+    
+    @property 
+    def value(self):
+        return self._value
+    
+    @value.setter 
+    def value(self, set_to:int):
+        SystemTime.before_pin_write()
+        self._value = set_to
+        
     @property 
     def name(self):
         return self._name
@@ -0,0 +1,45 @@
+'''
+Created on Oct 19, 2026
+
+Stand-in for the RP2040's PIOClockGenerator: same interface, but 
+the "hardware" just sets the signal to wherever the requested 
+number of transitions would have left it.  Enough to exercise 
+free-running clocks, and the scheduling around them, on the desktop.
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+
+class PIOClockGenerator:
+    def __init__(self, signal, state_machine:int=0, freq:int=None):
+        self.signal = signal
+        self.state_machine = state_machine
+        self.freq = freq
+        self._level = 0
+        self.runs = 0
+        self.transitions = 0
+        
+    @property 
+    def level(self) -> int:
+        return self._level
+        
+    def set_level(self, level:int):
+        self._level = 1 if level else 0
+        self.signal.value = self._level
+        
+    def run_transitions(self, num:int):
+        '''
+            Toggle the clock num times, returning once that's done
+        '''
+        if num < 1:
+            return 
+        self.runs += 1
+        self.transitions += num
+        if num & 1:
+            self.set_level(not self._level)
+            
+    def stop(self):
+        pass
+    
+    def __repr__(self):
+        return f'<PIOClockGenerator (emulated) {self.signal}>'
@@ -0,0 +1,139 @@
+'''
+Created on Oct 19, 2026
+
+Emulated RP2040 SIO registers, so the SIOPort/SIOPin API may be used
+(and tested) off-device.
+
+mem32 behaves like the real SIO block: the SET/CLR/XOR aliases act
+on GPIO_OUT and GPIO_OE, and GPIO_IN shows outputs where enabled and
+whatever was drive()n onto the other pins.
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+from microcotb.time.system import SystemTime
+from microcotb.platform.siomap import SIORegister, gpio_mask, gpio_runs
+
+class SIORegisters:
+    AliasOps = {
+        SIORegister.OUT_SET: (SIORegister.OUT, lambda cur, v: cur | v),
+        SIORegister.OUT_CLR: (SIORegister.OUT, lambda cur, v: cur & ~v),
+        SIORegister.OUT_XOR: (SIORegister.OUT, lambda cur, v: cur ^ v),
+        SIORegister.OE_SET: (SIORegister.OE, lambda cur, v: cur | v),
+        SIORegister.OE_CLR: (SIORegister.OE, lambda cur, v: cur & ~v),
+        SIORegister.OE_XOR: (SIORegister.OE, lambda cur, v: cur ^ v),
+    }
+    def __init__(self):
+        self.regs = {SIORegister.OUT: 0, SIORegister.OE: 0}
+        self.external = 0
+        self.writes = 0
+
+    def drive(self, gpio:int, level:int):
+        '''
+            Drive an input pin from the outside.
+        '''
+        if level:
+            self.external |= (1 << gpio)
+        else:
+            self.external &= ~(1 << gpio)
+
+    def __getitem__(self, addr:int) -> int:
+        if addr == SIORegister.IN:
+            oe = self.regs[SIORegister.OE]
+            return (self.regs[SIORegister.OUT] & oe) | (self.external & ~oe)
+        return self.regs[addr]
+
+    def __setitem__(self, addr:int, value:int):
+        self.writes += 1
+        if addr in self.AliasOps:
+            reg, op = self.AliasOps[addr]
+            self.regs[reg] = op(self.regs[reg], value)
+        else:
+            self.regs[addr] = value
+
+mem32 = SIORegisters()
+
+
+def make_reader(gpios:list, register:int=SIORegister.IN):
+    runs = gpio_runs(gpios)
+    def read_runs():
+        v = mem32[register]
+        val = 0
+        for g, b, m in runs:
+            val |= ((v >> g) & m) << b
+        return val
+    return read_runs
+
+def make_writer(gpios:list, register:int=SIORegister.OUT):
+    xor_register = register + (SIORegister.OUT_XOR - SIORegister.OUT)
+    mask = gpio_mask(gpios)
+    runs = gpio_runs(gpios)
+    def write_runs(val):
+        bits = 0
+        for g, b, m in runs:
+            bits |= ((val >> b) & m) << g
+        mem32[xor_register] = (mem32[register] ^ bits) & mask
+    return write_runs
+
+def make_masked_writer(gpios:list, register:int=SIORegister.OUT):
+    xor_register = register + (SIORegister.OUT_XOR - SIORegister.OUT)
+    runs = gpio_runs(gpios)
+    def write_masked(mask, val):
+        gpio_mask = 0
+        bits = 0
+        for g, b, m in runs:
+            gpio_mask |= ((mask >> b) & m) << g
+            bits |= ((val >> b) & m) << g
+        mem32[xor_register] = (mem32[register] ^ bits) & gpio_mask
+    return write_masked
+
+
+class SIOPort:
+    def __init__(self, gpios:list, output:bool=False):
+        self.gpios = list(gpios)
+        self.mask = gpio_mask(self.gpios)
+        if output:
+            mem32[SIORegister.OE_SET] = self.mask
+        else:
+            mem32[SIORegister.OE_CLR] = self.mask
+
+        self.read = make_reader(self.gpios)
+        self.write = make_writer(self.gpios)
+        self.read_oe = make_reader(self.gpios, SIORegister.OE)
+        self.write_oe = make_writer(self.gpios, SIORegister.OE)
+        self.set_bits = make_masked_writer(self.gpios)
+
+    def __repr__(self):
+        return f'<SIOPort {self.gpios}>'
+
+
+class SIOPin:
+    def __init__(self, name:str, gpio:int, output:bool=True):
+        self._name = name
+        self.gpio = gpio
+        self.mask = 1 << gpio
+        if output:
+            mem32[SIORegister.OE_SET] = self.mask
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def value(self):
+        return (mem32[SIORegister.IN] >> self.gpio) & 1
+
+    @value.setter
+    def value(self, set_to:int):
+        SystemTime.before_pin_write()
+        if set_to:
+            mem32[SIORegister.OUT_SET] = self.mask
+        else:
+            mem32[SIORegister.OUT_CLR] = self.mask
+
+    def fast_toggle(self):
+        SystemTime.before_pin_write()
+        mem32[SIORegister.OUT_XOR] = self.mask
+
+    def __repr__(self):
+        return f'<SIOPin {self._name} (GPIO {self.gpio})>'
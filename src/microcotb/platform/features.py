@@ -7,6 +7,7 @@ Created on Nov 26, 2024
 class Features:
     SleepMsUs = False
     TicksUs = False
+    PIOClock = False # clocks may be generated in hardware (PIOClockGenerator)
     FunctionsHaveQualifiedNames = False
     ExceptionsHaveTraceback = False
     
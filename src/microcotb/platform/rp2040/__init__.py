@@ -1,8 +1,11 @@
 from .pin import PinWrapper
+from .sio import SIOPort, SIOPin
+from .pio_clock import PIOClockGenerator
 from ..features import Features
 
 Features.SleepMsUs = True
 Features.TicksUs = True
+Features.PIOClock = True
 
 import sys 
 import io
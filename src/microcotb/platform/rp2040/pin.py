@@ -6,6 +6,7 @@ Created on Nov 26, 2024
 '''
 
 from machine import Pin
+from microcotb.time.system import SystemTime
 
 class PinWrapper:
     def __init__(self, name:str, pin):
@@ -23,6 +24,7 @@ class PinWrapper:
     
     @value.setter 
     def value(self, set_to:int):
+        SystemTime.before_pin_write()
         #if self._pin.mode != Pin.OUT:
         #    self._pin.mode = Pin.OUT
         self._pin.value(set_to)
@@ -0,0 +1,89 @@
+'''
+Created on Oct 19, 2026
+
+Clock edges generated by a PIO state machine.
+
+Give it to a Clock
+
+    clock = Clock(dut.clk, 10, 'us')
+    clock.use_generator(PIOClockGenerator(dut.clk))
+    cocotb.start_soon(clock.start())
+
+and any number of toggles due when time advances are handed over
+in one go: the count is pushed to the state machine, which flips
+the pin that many times and raises an IRQ when done.  With every
+clock running like this, Timer and ClockCycles move time
+forward arithmetically rather than a half period at a time.
+
+The signal may be an SIOPin or anything with a gpio attribute, or
+just the GPIO number.
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import rp2
+from machine import Pin
+
+@rp2.asm_pio(out_init=rp2.PIO.OUT_LOW, set_init=rp2.PIO.OUT_LOW)
+def clock_toggles():
+    pull(block)
+    mov(x, osr)             # number of toggles - 1
+    label('toggle')
+    mov(pins, invert(pins))
+    jmp(x_dec, 'toggle')
+    irq(rel(0))
+
+
+class PIOClockGenerator:
+    DefaultFrequency = 2_000_000 # SM cycles, 2 per toggle
+    
+    def __init__(self, signal, state_machine:int=0, freq:int=None):
+        self.signal = signal
+        self.gpio = getattr(signal, 'gpio', signal)
+        self.state_machine = state_machine
+        self.freq = freq if freq is not None else self.DefaultFrequency
+        self._done = False
+        self._level = 0
+        pin = Pin(self.gpio)
+        self._sm = rp2.StateMachine(state_machine, clock_toggles, freq=self.freq,
+                                    in_base=pin, out_base=pin, set_base=pin)
+        self._sm.irq(self._irq_handler)
+        self._sm.active(1)
+        self.runs = 0
+        self.transitions = 0
+        
+    def _irq_handler(self, sm):
+        self._done = True
+        
+    @property 
+    def level(self) -> int:
+        return self._level
+    
+    def set_level(self, level:int):
+        self._level = 1 if level else 0
+        if self._level:
+            self._sm.exec('set(pins, 1)')
+        else:
+            self._sm.exec('set(pins, 0)')
+        
+    def run_transitions(self, num:int):
+        '''
+            Toggle the clock num times, blocking until the 
+            state machine says it's done
+        '''
+        if num < 1:
+            return 
+        self._done = False
+        self._sm.put(num - 1)
+        while not self._done:
+            pass
+        self.runs += 1
+        self.transitions += num
+        if num & 1:
+            self._level ^= 1
+            
+    def stop(self):
+        self._sm.active(0)
+        
+    def __repr__(self):
+        return f'<PIOClockGenerator GPIO {self.gpio} on SM {self.state_machine}>'
@@ -0,0 +1,171 @@
+'''
+Created on Oct 19, 2026
+
+Ports and pins mapped straight onto the RP2040's single-cycle IO
+(SIO) registers.
+
+Rather than going through a machine.Pin per bit, a port is a set of
+GPIOs (LSB first) which are read in one go from GPIO_IN and written
+with a single write to GPIO_OUT_XOR, flipping only the bits that
+need to change.  Readers and writers are specialized for the
+layout at hand (one contiguous run of GPIOs, two runs like the TT
+ui_in, or anything else) and compiled with the native emitter.
+
+    ui = SIOPort([9, 10, 11, 12, 17, 18, 19, 20], output=True)
+    dut.add_port('ui_in', 8, ui.read, ui.write)
+    dut.clk = SIOPin('clk', 0)
+
+SIOPin's fast_toggle() is used by Clock, so each clock edge is a
+single register write.
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import micropython
+from machine import Pin, mem32
+from microcotb.time.system import SystemTime
+from microcotb.platform.siomap import SIORegister, gpio_mask, gpio_runs
+
+
+def make_reader(gpios:list, register:int=SIORegister.IN):
+    runs = gpio_runs(gpios)
+    if len(runs) == 1:
+        g0, _b0, m0 = runs[0]
+        @micropython.native
+        def read_one_run():
+            return (mem32[register] >> g0) & m0
+        return read_one_run
+
+    if len(runs) == 2:
+        g0, b0, m0 = runs[0]
+        g1, b1, m1 = runs[1]
+        @micropython.native
+        def read_two_runs():
+            v = mem32[register]
+            return (((v >> g0) & m0) << b0) | (((v >> g1) & m1) << b1)
+        return read_two_runs
+
+    runs = tuple(runs)
+    @micropython.native
+    def read_runs():
+        v = mem32[register]
+        val = 0
+        for g, b, m in runs:
+            val |= ((v >> g) & m) << b
+        return val
+    return read_runs
+
+def make_writer(gpios:list, register:int=SIORegister.OUT):
+    '''
+        A function to set the gpios to a value, by xor-ing
+        in only the bits that differ from their current state.
+        register is OUT, or OE to set output enables.
+    '''
+    xor_register = register + (SIORegister.OUT_XOR - SIORegister.OUT)
+    mask = gpio_mask(gpios)
+    runs = gpio_runs(gpios)
+    if len(runs) == 1:
+        g0, _b0, _m0 = runs[0]
+        @micropython.native
+        def write_one_run(val):
+            mem32[xor_register] = (mem32[register] ^ (val << g0)) & mask
+        return write_one_run
+
+    if len(runs) == 2:
+        g0, b0, m0 = runs[0]
+        g1, b1, m1 = runs[1]
+        @micropython.native
+        def write_two_runs(val):
+            val = (((val >> b0) & m0) << g0) | (((val >> b1) & m1) << g1)
+            mem32[xor_register] = (mem32[register] ^ val) & mask
+        return write_two_runs
+
+    runs = tuple(runs)
+    @micropython.native
+    def write_runs(val):
+        bits = 0
+        for g, b, m in runs:
+            bits |= ((val >> b) & m) << g
+        mem32[xor_register] = (mem32[register] ^ bits) & mask
+    return write_runs
+
+def make_masked_writer(gpios:list, register:int=SIORegister.OUT):
+    '''
+        A function to set only the bits in mask (as port bits, 
+        not gpios) to those of val, as a Port's signal_set_bits.
+    '''
+    xor_register = register + (SIORegister.OUT_XOR - SIORegister.OUT)
+    runs = tuple(gpio_runs(gpios))
+    @micropython.native
+    def write_masked(mask, val):
+        gpio_mask = 0
+        bits = 0
+        for g, b, m in runs:
+            gpio_mask |= ((mask >> b) & m) << g
+            bits |= ((val >> b) & m) << g
+        mem32[xor_register] = (mem32[register] ^ bits) & gpio_mask
+    return write_masked
+
+
+class SIOPort:
+    '''
+        A number of GPIOs, LSB first, as a port: read/write
+        for values, read_oe/write_oe for output enables (1 is output), 
+        and set_bits to change only some of them.
+    '''
+    def __init__(self, gpios:list, output:bool=False):
+        self.gpios = list(gpios)
+        self.mask = gpio_mask(self.gpios)
+        # hand the pins over to SIO, in the right direction
+        mode = Pin.OUT if output else Pin.IN
+        self._pins = list(map(lambda g: Pin(g, mode), self.gpios))
+
+        self.read = make_reader(self.gpios)
+        self.write = make_writer(self.gpios)
+        self.read_oe = make_reader(self.gpios, SIORegister.OE)
+        self.write_oe = make_writer(self.gpios, SIORegister.OE)
+        self.set_bits = make_masked_writer(self.gpios)
+
+    def __repr__(self):
+        return f'<SIOPort {self.gpios}>'
+
+
+class SIOPin:
+    '''
+        A single GPIO, usable anywhere a PinWrapper is.
+    '''
+    def __init__(self, name:str, gpio:int, output:bool=True):
+        self._name = name
+        self.gpio = gpio
+        self._pin = Pin(gpio, Pin.OUT if output else Pin.IN)
+        self.mask = 1 << gpio
+        mask = self.mask
+        xor_register = SIORegister.OUT_XOR
+
+        @micropython.native
+        def toggle():
+            mem32[xor_register] = mask
+        self._toggle = toggle
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def value(self):
+        return (mem32[SIORegister.IN] >> self.gpio) & 1
+
+    @value.setter
+    def value(self, set_to:int):
+        SystemTime.before_pin_write()
+        if set_to:
+            mem32[SIORegister.OUT_SET] = self.mask
+        else:
+            mem32[SIORegister.OUT_CLR] = self.mask
+
+    def fast_toggle(self):
+        SystemTime.before_pin_write()
+        self._toggle()
+
+    def __repr__(self):
+        return f'<SIOPin {self._name} (GPIO {self.gpio})>'
@@ -0,0 +1,41 @@
+'''
+Created on Oct 19, 2026
+
+RP2040 single-cycle IO (SIO) register addresses, and how sets
+of GPIOs map onto them.  Shared by the real (rp2040) and
+emulated (dummy) SIO ports.
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+
+class SIORegister:
+    IN = 0xd0000004
+    OUT = 0xd0000010
+    OUT_SET = 0xd0000014
+    OUT_CLR = 0xd0000018
+    OUT_XOR = 0xd000001c
+    OE = 0xd0000020
+    OE_SET = 0xd0000024
+    OE_CLR = 0xd0000028
+    OE_XOR = 0xd000002c
+
+
+def gpio_mask(gpios:list) -> int:
+    mask = 0
+    for g in gpios:
+        mask |= (1 << g)
+    return mask
+
+def gpio_runs(gpios:list) -> list:
+    '''
+        The gpios (LSB first), as a list of contiguous
+        (first gpio, first bit, bit mask) runs
+    '''
+    runs = []
+    start = 0
+    for i in range(1, len(gpios) + 1):
+        if i == len(gpios) or gpios[i] != gpios[i-1] + 1:
+            runs.append((gpios[start], start, (1 << (i - start)) - 1))
+            start = i
+    return runs
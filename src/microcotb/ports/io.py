@@ -7,6 +7,23 @@ Created on Nov 21, 2024
 from microcotb.types.ioport import IOPort
 from microcotb.types.handle import LogicObject
 from microcotb.types.logic_array import LogicArray
+from microcotb.clock import Clock
+from microcotb.time.system import SystemTime
+
+def _flush_deferred():
+    if SystemTime._deferred_writes:
+        SystemTime.flush_deferred_writes()
+
+def _toggle_clock(clock, cycles:int):
+    # clocked by hand: rising, then falling edge, for each cycle.
+    # DEFERRED writes have to be out before each edge, so the value 
+    # gets latched -- and the clock itself may be a deferred port
+    for _i in range(cycles):
+        _flush_deferred()
+        clock.value = 1
+        _flush_deferred()
+        clock.value = 0
+        _flush_deferred()
 
 
 class IO(LogicObject):
@@ -19,6 +36,10 @@ class IO(LogicObject):
         self._hashval = None
         self._ioidx = IO._IOPORT_COUNT
         IO._IOPORT_COUNT += 1
+        # limits for the u/s/bytes views, worked out once
+        self._max_unsigned = (1 << width) - 1
+        self._sign_bit = 1 << (width - 1)
+        self._num_bytes = (width + 7) // 8
         
         
     def __hash__(self): 
@@ -32,10 +53,10 @@ class IO(LogicObject):
     
     @property
     def last_value_as_array(self) -> LogicArray:
-        return LogicArray._from_handle(self.port.last_value_bin_str)
+        return self.port.value_as_array(self.port.last_value)
     
     def value_as_array(self, v:int) -> LogicArray:
-        return LogicArray._from_handle(self.port.last_value_bin_str)
+        return self.port.value_as_array(v)
     
     @property 
     def is_readable(self) -> bool:
@@ -51,7 +72,61 @@ class IO(LogicObject):
     
     @property 
     def max_value(self) -> int:
-        return (2**self.port.width)-1
+        return self._max_unsigned
+    
+    @property 
+    def u(self) -> int:
+        '''
+            The port's value, as an unsigned int.  Like 
+            int(io.value), but with no LogicArray involved.
+        '''
+        return self.port.get_signal_val_int()
+    
+    @u.setter 
+    def u(self, set_to:int):
+        if not (0 <= set_to <= self._max_unsigned):
+            raise ValueError(f"Unsigned value ({set_to!r}) out of range for {self.port.width}-bit port ({self.name!r})")
+        self.port.set_signal_val_int(set_to)
+        
+    @property 
+    def s(self) -> int:
+        '''
+            The port's value, as a signed (two's complement) int, 
+            like io.value.to_signed()
+        '''
+        v = self.port.get_signal_val_int()
+        if v is not None and v & self._sign_bit:
+            return v - (self._max_unsigned + 1)
+        return v
+    
+    @s.setter 
+    def s(self, set_to:int):
+        if not (-self._sign_bit <= set_to < self._sign_bit):
+            raise ValueError(f"Signed value ({set_to!r}) out of range for {self.port.width}-bit port ({self.name!r})")
+        self.port.set_signal_val_int(set_to & self._max_unsigned)
+        
+    def bytes(self, num_bytes:int=None, byteorder:str='big') -> bytes:
+        '''
+            The port's value as bytes, as many as it takes 
+            to hold the width unless num_bytes is specified.
+            None if nothing could be read, as for u and s.
+        '''
+        v = self.port.get_signal_val_int()
+        if v is None:
+            return None
+        if num_bytes is None:
+            num_bytes = self._num_bytes
+        return v.to_bytes(num_bytes, byteorder)
+    
+    def set_bytes(self, value, byteorder:str='big'):
+        '''
+            Set the port from bytes/bytearray, like 
+            io.value = LogicArray.from_bytes(value).
+        '''
+        v = int.from_bytes(value, byteorder)
+        if v > self._max_unsigned:
+            raise OverflowError(f"{len(value)} bytes will not fit in {self.port.width}-bit port ({self.name!r})")
+        self.port.set_signal_val_int(v)
     
     @property 
     def signal_read(self):
@@ -66,29 +141,144 @@ class IO(LogicObject):
     def signal_write(self, func):
         self.port.signal_write = func
         
+    @property 
+    def signal_set_bits(self):
+        return self.port.signal_set_bits
+    @signal_set_bits.setter 
+    def signal_set_bits(self, func):
+        self.port.signal_set_bits = func
+        
     @property 
     def name(self) -> str:
         return self.port.name
         
+    def __setitem__(self, key, value):
+        # bits and slices set from ints are masked writes on the port,
+        # anything else goes the long way, through a LogicArray
+        if isinstance(value, int) and self.port.signal_write is not None:
+            mask_and_bits = self._masked_bits(key, value)
+            if mask_and_bits is not None:
+                self.port.set_bits(mask_and_bits[0], mask_and_bits[1])
+                return
+        super().__setitem__(key, value)
+        
+    def _masked_bits(self, key, value:int):
+        '''
+            (mask, bits) to set value at key, None if that's not 
+            something sensible (which the LogicArray will complain about)
+        '''
+        width = self.port.width
+        if isinstance(key, int):
+            if not (0 <= key < width) or value not in (0, 1):
+                return None
+            return (1 << key, value << key)
+        
+        if isinstance(key, slice) and key.step is None:
+            start = key.start if key.start is not None else width - 1
+            stop = key.stop if key.stop is not None else 0
+            if not (0 <= stop <= start < width):
+                return None
+            num_bits = start - stop + 1
+            if value < 0:
+                value += (1 << num_bits)
+            if not (0 <= value < (1 << num_bits)):
+                raise OverflowError(f"{value!r} will not fit in slice [{start}:{stop}]")
+            return (((1 << num_bits) - 1) << stop, value << stop)
+        return None
+        
     def invert(self):
-        self.value = ~self 
+        written = self.port.written_value
+        if written is None:
+            self.value = ~self 
+        else:
+            # we know what's on there, no need to read it back
+            mv = self.max_value
+            self.value = ~(mv & written) & mv
         
     def clock(self, n_times:int=1):
         for _i in range(n_times):
             self.invert()
             self.invert()
+            
+    async def write_sequence(self, values, clock, cycles:int=1):
+        '''
+            Stream values out through this port, a new one every 
+            cycles clock cycles: 
+            
+                await dut.ui_in.write_sequence(b'some bytes', clock=dut.clk)
+            
+            Values are checked and prepared all at once (see ValueSequence), 
+            which is returned.
+            
+            If a Clock is running on clock, this awaits ClockCycles between 
+            values.  Otherwise, the clock is toggled by hand and backends that 
+            support bursts get the whole sequence in a single call.
+        '''
+        from microcotb.types.sequence import ValueSequence
+        seq = ValueSequence(values, self.port.width)
+        if not len(seq):
+            return seq
+        port = self.port
+        vals = seq.tolist()
+        if Clock.get(clock) is not None:
+            from microcotb.triggers import ClockCycles
+            for v in vals:
+                port.set_signal_val_int(v)
+                await ClockCycles(clock, cycles)
+            return seq
+        
+        port.flush()
+        burst = port.signal_write_sequence
+        if burst is not None and burst(vals, clock, cycles):
+            port.sequence_written(vals[-1], len(vals))
+            return seq
+        for v in vals:
+            port.set_signal_val_int(v)
+            _toggle_clock(clock, cycles)
+        return seq
+    
+    async def read_sequence(self, count:int, clock, cycles:int=1):
+        '''
+            Read count values from this port, one every cycles clock 
+            cycles, returned as a ValueSequence.  Clocking is as for 
+            write_sequence().
+        '''
+        from microcotb.types.sequence import ValueSequence
+        port = self.port
+        vals = None
+        if Clock.get(clock) is not None:
+            from microcotb.triggers import ClockCycles
+            vals = []
+            for _i in range(count):
+                vals.append(port.get_signal_val_int())
+                await ClockCycles(clock, cycles)
+            return ValueSequence(vals, port.width)
+        
+        burst = port.signal_read_sequence
+        if burst is not None and count:
+            port.flush()
+            vals = burst(count, clock, cycles)
+            if vals is not None:
+                port.do_force_update_last_value(vals[-1])
+        if vals is None:
+            vals = []
+            for _i in range(count):
+                vals.append(port.get_signal_val_int())
+                _toggle_clock(clock, cycles)
+        return ValueSequence(vals, port.width)
+    
     def __repr__(self):
         val = hex(int(self.value)) if self.port.is_readable  else ''
         return f'<IO {self.name} {val}>'
     
     def __int__(self):
         if self.port.is_readable:
-            return int(self.value)
+            return self.port.get_signal_val_int()
         return None
     
     
     def __invert__(self):
-        mv = self.max_value
+        mv = self._max_unsigned
         return ~(mv & int(self)) & mv
     
     def __str__(self):
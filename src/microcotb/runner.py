@@ -53,6 +53,7 @@ class Runner:
     def test(self, dut:DUT):
         from microcotb.time.system import SystemTime
         from microcotb.clock import Clock
+        from microcotb.scheduler import Scheduler
         steps_p_sec_tot = 0
         num_stepps_avged = 0
         dut.testing_will_begin()
@@ -72,6 +73,7 @@ class Runner:
             nm = self.test_names[test_count]
             SystemTime.reset()
             Clock.clear_all()
+            Scheduler.clear_all()
             test = self.tests_to_run[nm]
             if test.timeout is None:
                 SystemTime.clear_timeout()
@@ -108,6 +110,7 @@ class Runner:
                 if PropExceptions:
                     raise e
                 
+            SystemTime.flush_deferred_writes()
             test.real_time = time.runtime_delta_secs(t_start_s)
             test.run_time = SystemTime.current()
             if test.skip: 
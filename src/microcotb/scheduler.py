@@ -0,0 +1,220 @@
+'''
+Created on Oct 19, 2026
+
+Lightweight cooperative scheduling of coroutines launched
+with start_soon().
+
+The test itself drives time: each time SystemTime advances,
+background tasks whose wake up time has been reached get resumed,
+until they await something else.
+
+Awaiting a Timer, ClockCycles, or edges on a clock signal gives
+a known wake up time, so those tasks sit in a time-ordered heap
+and cost nothing until they're due.  Only edges on non-clock signals
+need to be checked on every step.
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import heapq
+import microcotb.log as logging
+
+log = logging.getLogger(__name__)
+
+class Task:
+    '''
+        A coroutine running in the background.
+        Await it to wait for it to complete.
+    '''
+    def __init__(self, coro):
+        self._coro = coro
+        self.name = getattr(coro, '__name__', str(coro))
+        self._done = False
+        self._cancelled = False
+        self._result = None
+        self._exception = None
+        self._joiners = []
+
+    def done(self) -> bool:
+        return self._done
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def result(self):
+        if self._exception is not None:
+            raise self._exception
+        return self._result
+
+    def exception(self):
+        return self._exception
+
+    def cancel(self):
+        if self._done:
+            return
+        self._cancelled = True
+        self._coro.close()
+        self._finish()
+
+    def kill(self):
+        self.cancel()
+
+    def _finish(self, result=None, exception=None):
+        self._done = True
+        self._result = result
+        self._exception = exception
+        joiners = self._joiners
+        self._joiners = []
+        for j in joiners:
+            Scheduler.wake_now(j)
+
+    def __await__(self):
+        if Scheduler.in_task():
+            if not self._done:
+                yield self
+            return self.result()
+
+        # awaited by the test: run time forward until we're done
+        from microcotb.time.system import SystemTime
+        from microcotb.time.value import TimeValue
+        from microcotb.clock import Clock
+        while not self._done:
+            step = Clock.get_shortest_event_interval()
+            if step is not None:
+                SystemTime.advance(step)
+                continue
+            # no clocks, jump straight to whatever's next
+            wake_at = Scheduler.next_wake_time()
+            if wake_at is None:
+                raise RuntimeError(f'{self} can never complete')
+            now = SystemTime.current()
+            if wake_at <= now:
+                Scheduler.time_is_now(now)
+            else:
+                SystemTime.advance(TimeValue(wake_at.time_in(now.units) - now.time, now.units))
+        yield
+        return self.result()
+
+    def __repr__(self):
+        state = 'done' if self._done else 'pending'
+        return f'<Task {self.name} {state}>'
+
+
+class Scheduler:
+    _timed = [] # heap of (wake time, sequence, task)
+    _polled = [] # (trigger, task) to check on every step
+    _ready = [] # to run at the current time, before it moves on
+    _sequence = 0
+    _current = None
+
+    @classmethod
+    def start_soon(cls, coro) -> Task:
+        if isinstance(coro, Task):
+            return coro
+        if coro is None or not hasattr(coro, 'send'):
+            # e.g. start_soon(clock.start()), which needs no scheduling
+            return None
+        task = Task(coro)
+        cls.wake_now(task)
+        return task
+
+    @classmethod
+    def in_task(cls) -> bool:
+        return cls._current is not None
+
+    @classmethod
+    def current_task(cls) -> Task:
+        return cls._current
+
+    @classmethod
+    def wake_now(cls, task:Task):
+        cls._ready.append(task)
+
+    @classmethod
+    def wake_at(cls, at_time, task:Task):
+        cls._sequence += 1
+        heapq.heappush(cls._timed, (at_time, cls._sequence, task))
+
+    @classmethod
+    def next_wake_time(cls):
+        if len(cls._ready):
+            from microcotb.time.system import SystemTime
+            return SystemTime.current()
+        if not len(cls._timed):
+            return None
+        return cls._timed[0][0]
+
+    @classmethod
+    def run_ready(cls):
+        while len(cls._ready):
+            ready = cls._ready
+            cls._ready = []
+            for task in ready:
+                if not task._done:
+                    cls._resume(task)
+
+    @classmethod
+    def time_is_now(cls, now):
+        cls.run_ready()
+        while len(cls._timed) and cls._timed[0][0] <= now:
+            task = heapq.heappop(cls._timed)[2]
+            if not task._done:
+                cls._resume(task)
+
+        if len(cls._polled):
+            waiting = cls._polled
+            cls._polled = []
+            for trig, task in waiting:
+                if task._done:
+                    continue
+                if trig is None or trig.conditions_met():
+                    cls._resume(task)
+                else:
+                    cls._polled.append((trig, task))
+        cls.run_ready()
+
+    @classmethod
+    def clear_all(cls):
+        tasks = list(map(lambda e: e[2], cls._timed)) + list(map(lambda e: e[1], cls._polled)) + cls._ready
+        cls._timed = []
+        cls._polled = []
+        cls._ready = []
+        for task in tasks:
+            task.cancel()
+        # anything joining the cancelled was just readied, drop it too
+        cls._ready = []
+
+    @classmethod
+    def _resume(cls, task:Task):
+        prev = cls._current
+        cls._current = task
+        try:
+            trigger = task._coro.send(None)
+        except StopIteration as e:
+            task._finish(result=e.value)
+            return
+        except Exception as e:
+            log.error(f'{task} raised {e}')
+            task._finish(exception=e)
+            raise e
+        finally:
+            cls._current = prev
+
+        cls._park(task, trigger)
+
+    @classmethod
+    def _park(cls, task:Task, trigger):
+        if isinstance(trigger, Task):
+            trigger._joiners.append(task)
+            return
+
+        if trigger is None or not hasattr(trigger, 'schedule_time'):
+            # bare yield or foreign awaitable, come back on next step
+            cls._polled.append((None, task))
+            return
+
+        wake_time = trigger.schedule_time()
+        if wake_time is not None:
+            cls.wake_at(wake_time, task)
+        else:
+            cls._polled.append((trigger, task))
@@ -0,0 +1,80 @@
+'''
+Created on Oct 19, 2026
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+from microcotb.time.value import TimeValue
+
+class Snapshot:
+    '''
+        An immutable view of every readable signal of a DUT,
+        all gotten in one go at a given time.
+
+        Values are plain ints, accessible by name as
+
+            snap['uo_out']
+        or
+            snap.uo_out
+
+        Bit and slice attributes are extracted from their
+        source port's value, as needed.
+    '''
+    __slots__ = ('_time', '_values', '_slices')
+    
+    def __init__(self, at_time:TimeValue, values:dict, slices:dict=None):
+        super().__setattr__('_time', at_time)
+        super().__setattr__('_values', values)
+        super().__setattr__('_slices', slices if slices is not None else dict())
+        
+    def __setattr__(self, name:str, value):
+        raise AttributeError(f'Snapshots are read-only, cannot set "{name}"')
+
+    @property
+    def time(self) -> TimeValue:
+        return self._time
+
+    def names(self):
+        return list(self._values.keys()) + list(self._slices.keys())
+
+    def items(self):
+        return list(map(lambda nm: (nm, self[nm]), self.names()))
+
+    def get(self, name:str, default=None):
+        if name not in self:
+            return default
+        return self[name]
+
+    def __getitem__(self, name:str) -> int:
+        if name in self._values:
+            return self._values[name]
+
+        slc = self._slices[name]
+        return slc.bits_from(self._values[slc._io.name])
+
+    def __getattr__(self, name:str) -> int:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(f'No "{name}" in snapshot') from None
+
+    def __contains__(self, name:str) -> bool:
+        return name in self._values or name in self._slices
+
+    def __iter__(self):
+        return iter(self.names())
+
+    def __len__(self):
+        return len(self._values) + len(self._slices)
+
+    def __repr__(self):
+        return f'<Snapshot @ {self.time} ({len(self)} signals)>'
+
+    def __str__(self):
+        outlist = []
+        for k,v in self.items():
+            outlist.append(f'{k} = {hex(v)} ({bin(v)})')
+        deets = '\n  '.join(outlist)
+        return f'Snapshot @ {self.time}:\n  {deets}'
@@ -7,6 +7,8 @@ Created on Dec 8, 2024
 
 from microcotb.ports.io import IO
 from microcotb.types.logic_array import LogicArray
+from microcotb.types.logic import Logic
+from microcotb.types.range import Range
 from microcotb.types.with_value import WithValue
 
 class NoopSignal(WithValue):
@@ -35,8 +37,27 @@ class SliceWrapper(WithValue):
         self.slice_start = idx_or_start
         self.slice_end = slice_end
         
+        # everything needed to pull our bits out of (or put them into)
+        # the port's int value, worked out once
+        if slice_end is not None:
+            if idx_or_start < slice_end:
+                # ports are always (width-1 downto 0)
+                raise IndexError(
+                    f"slice [{idx_or_start}:{slice_end}] direction does not match array direction [{io.port.width - 1}:0]")
+            self.shift = slice_end
+            self._width = (idx_or_start - slice_end) + 1
+            self._range = Range.interned(idx_or_start, 'downto', slice_end)
+        else:
+            self.shift = idx_or_start
+            self._width = 1
+            self._range = None
+        self.mask = (1 << self._width) - 1
+        self.port_mask = self.mask << self.shift
+        self._hashval = hash(f'{self._name}{self.slice_start}{self.slice_end}')
+        
     def __hash__(self)->int:
-        return hash(f'{self._name}{self.slice_start}{self.slice_end}')
+        return self._hashval
+    
     def out_of_array(self, la:LogicArray) -> LogicArray:
         if self.slice_end is not None:
             v = la[self.slice_start:self.slice_end]
@@ -44,16 +65,59 @@ class SliceWrapper(WithValue):
             v = la[self.slice_start]
         return v
     
+    def bits_from(self, port_value:int) -> int:
+        '''
+            Our bits, as an int, out of the parent port's value.
+        '''
+        return (port_value >> self.shift) & self.mask
+    
+    def _wrap(self, bits:int):
+        # same types as slicing the port's LogicArray would give
+        if self._range is None:
+            return Logic._from_literal[bits]
+        return LogicArray._from_planes(bits, self._range)
+    
+    @classmethod
+    def read_together(cls, *slices) -> list:
+        '''
+            The values, as ints, of a number of slices/bits, 
+            reading each of the ports involved only once:
+            
+                busy, ready = SliceWrapper.read_together(dut.busy, dut.resultReady)
+        '''
+        port_values = dict()
+        vals = []
+        for slc in slices:
+            io = slc._io
+            if io not in port_values:
+                port_values[io] = io.port.get_signal_val_int()
+            v = port_values[io]
+            vals.append(None if v is None else slc.bits_from(v))
+        return vals
     
     @property 
     def value(self):
-        if self.slice_end is not None:
-            return self._io[self.slice_start:self.slice_end]
-        
-        return self._io[self.slice_start]
+        v = self._io.port.get_signal_val_int()
+        if v is None:
+            return None
+        return self._wrap((v >> self.shift) & self.mask)
     
     @value.setter 
     def value(self, set_to:int):
+        port = self._io.port
+        if isinstance(set_to, int) and port.signal_write is not None:
+            if self._range is None:
+                if set_to in (0, 1):
+                    port.set_bits(self.port_mask, set_to << self.shift)
+                    return
+            else:
+                if set_to < 0:
+                    set_to += (1 << self._width)
+                if not (0 <= set_to <= self.mask):
+                    raise OverflowError(f"{set_to!r} will not fit in slice [{self.slice_start}:{self.slice_end}]")
+                port.set_bits(self.port_mask, set_to << self.shift)
+                return
+            
         if self.slice_end is not None:
             self._io[self.slice_start:self.slice_end] = set_to
         else:
@@ -73,9 +137,7 @@ class SliceWrapper(WithValue):
     
     @property 
     def width(self):
-        if self.slice_end is not None:
-            return (self.slice_start - self.slice_end) + 1
-        return 1
+        return self._width
 
     def _get_item_keys(self, key):
         if isinstance(key, int):
@@ -105,9 +167,7 @@ class SliceWrapper(WithValue):
         return None
     
     def __len__(self):
-        if self.slice_end is None:
-            return 1
-        return len(self.value)
+        return self._width
             
     def __repr__(self):
         nm = self._io.port.name 
@@ -116,8 +176,5 @@ class SliceWrapper(WithValue):
         return f'<Slice {self._name} {nm}[{self.slice_start}] ({hex(self.value)})>'
         
     def __str__(self):
-        if self.slice_end is not None:
-            return str(self._io[self.slice_start:self.slice_end])
-        else:
-            return str(self._io[self.slice_start])
+        return str(self.value)
 
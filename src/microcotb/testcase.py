@@ -4,7 +4,6 @@ Created on Nov 27, 2024
 @author: Pat Deegan
 @copyright: Copyright (C) 2024 Pat Deegan, https://psychogenic.com
 '''
-import asyncio
 from microcotb.time.value import TimeValue
 from microcotb.platform import exception_as_str
 
@@ -40,6 +39,9 @@ class TestCase:
             dut._log.warning(f"{self.name} skip=True")
             return 
         func = self.function
+        # only needed once tests actually run, and asyncio is 
+        # one of the heaviest imports around
+        import asyncio
         try:
             asyncio.run(func(dut))
         except Exception as e:
@@ -6,6 +6,7 @@ Created on Nov 23, 2024
 '''
 from microcotb.time.value import TimeValue, TimeConverter
 from microcotb.clock import Clock
+from microcotb.scheduler import Scheduler
 import time
 
 class SystemTimeout(Exception):
@@ -19,9 +20,14 @@ class SystemTime:
                         TimeConverter.rescale(200, 'us', TimeValue.BaseUnits), 
                         TimeValue.BaseUnits)
     _timeout_setting = None
+    _step_epoch = 0
+    _deferred_writes = []
+    _step_listeners = []
     
     @classmethod 
     def reset(cls):
+        cls.flush_deferred_writes()
+        cls._step_epoch += 1
         if cls.ResetTime is None:
             cls._global_time = TimeValue(0, TimeValue.BaseUnits)
         else:
@@ -31,6 +37,91 @@ class SystemTime:
     def current(cls) -> TimeValue:
         return cls._global_time
     
+    @classmethod 
+    def epoch(cls) -> int:
+        '''
+            A counter that changes any time the state of the 
+            system may have: when time moves, or when something 
+            is written to the DUT. Values read with the same 
+            epoch are still valid.
+        '''
+        return cls._step_epoch
+    
+    @classmethod 
+    def invalidate_step(cls):
+        cls._step_epoch += 1
+        
+    @classmethod 
+    def defer_write(cls, port):
+        '''
+            port has a write pending, to be flush()ed on the next read, 
+            time advance or explicit flush_deferred_writes()
+        '''
+        cls._deferred_writes.append(port)
+        
+    @classmethod 
+    def flush_deferred_writes(cls):
+        if not cls._deferred_writes:
+            return 
+        pending = cls._deferred_writes
+        cls._deferred_writes = []
+        for port in pending:
+            port.flush()
+            
+    @classmethod 
+    def before_pin_write(cls):
+        '''
+            For pin backends, called just before a pin is driven: 
+            pending port writes go out first, and anything read 
+            so far is stale.
+        '''
+        if cls._deferred_writes:
+            cls.flush_deferred_writes()
+        cls._step_epoch += 1
+        
+    @classmethod 
+    def add_step_listener(cls, callback):
+        '''
+            callback() will be called on every advance, after pending 
+            writes are out but before time actually moves.
+        '''
+        if callback not in cls._step_listeners:
+            cls._step_listeners.append(callback)
+            
+    @classmethod 
+    def remove_step_listener(cls, callback):
+        if callback in cls._step_listeners:
+            cls._step_listeners.remove(callback)
+        
+    @classmethod 
+    def run_free_until(cls, target:TimeValue) -> bool:
+        '''
+            When all the clocks are generated in hardware (see 
+            Clock.use_generator), move time to target arithmetically, 
+            in as few advances as background tasks allow.
+            
+            Returns False if this can't be done, or stopped being
+            possible on the way, in which case the caller steps through
+            the rest as usual.
+        '''
+        if cls.ForceSleepOnAdvance or not Clock.all_run_free():
+            return False
+        while cls._global_time < target:
+            if Scheduler._ready:
+                # tasks just started/woken need to say when they 
+                # want to wake next, before we decide how far to go
+                Scheduler.run_ready()
+            if Scheduler._polled:
+                # someone needs checking at every step
+                return False
+            stop = target
+            wake_at = Scheduler.next_wake_time()
+            if wake_at is not None and cls._global_time < wake_at < target:
+                stop = wake_at
+            cls.advance(TimeValue(stop._t_baseunits - cls._global_time._t_baseunits, 
+                                  TimeValue.BaseUnits))
+        return True
+        
     @classmethod 
     def set_timeout(cls, delta_time:TimeValue):
         cls._timeout_setting = cls.current() + delta_time
@@ -53,7 +144,17 @@ class SystemTime:
         else:
             raise ValueError
         
+        if Scheduler._ready:
+            # newly started/woken tasks get to go before time moves
+            Scheduler.run_ready()
+        if cls._deferred_writes:
+            # get everything out before any clock edge
+            cls.flush_deferred_writes()
+        if cls._step_listeners:
+            for cb in cls._step_listeners:
+                cb()
         cls._global_time += tstep
+        cls._step_epoch += 1
         #if cls._min_sleep_time < tstep:
         #    time.sleep_us(int(tstep.time_in('us')))
             
@@ -65,4 +166,11 @@ class SystemTime:
             clk.time_is_now(cls._global_time)
             if cls.ForceSleepOnAdvance:
                 time.sleep(cls.ForceSleepOnAdvance)
+        
+        if Scheduler._timed or Scheduler._polled:
+            # wake any background tasks that are due
+            Scheduler.time_is_now(cls._global_time)
+        
+        if cls._deferred_writes:
+            cls.flush_deferred_writes()
             
\ No newline at end of file
@@ -61,6 +61,7 @@ class TimeConverter:
         
     
 class TimeValue:
+    __slots__ = ('_time', '_units', '_un', '_as_float', '_t_baseunits')
     ReBaseStringUnits = False # go up units in str repr
     BaseUnits = 'ns'
     BaseUn = TimeConverter.UnitIndices['ns']
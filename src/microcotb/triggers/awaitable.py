@@ -8,6 +8,8 @@ Created on Nov 23, 2024
 import microcotb.log as logging 
 
 class Awaitable:
+    __slots__ = ('signal', '_log')
+    
     def __init__(self, signal=None):
         self.signal = signal
         self._log = None
@@ -19,6 +21,15 @@ class Awaitable:
             
         return self._log
             
+    def schedule_time(self):
+        '''
+            When a task awaiting this should be woken, if known.
+        '''
+        return None
+    
+    def conditions_met(self):
+        return True
+            
     def __iter__(self):
         return self
 
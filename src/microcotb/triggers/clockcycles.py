@@ -7,8 +7,11 @@ Created on Nov 23, 2024
 from microcotb.triggers.awaitable import Awaitable
 from microcotb.clock import Clock
 from microcotb.time.system import SystemTime
+from microcotb.scheduler import Scheduler
     
 class ClockCycles(Awaitable):
+    __slots__ = ('num_cycles', 'num_transitions', 'rising')
+    
     def __init__(self, sig, num_cycles:int, rising:bool=True):
         super().__init__(sig)
         self.num_cycles = num_cycles
@@ -18,19 +21,29 @@ class ClockCycles(Awaitable):
     def __iter__(self):
         return self
 
-    def next(self): 
+    def schedule_time(self):
         clk = Clock.get(self.signal)
+        if clk is None:
+            return None
         
         self.num_transitions = self.num_cycles * 2
         if (self.rising and self.signal.value == 0 or
             not self.rising and self.signal.value == 1):
             self.num_transitions -= 1
         
-        if clk is None:
+        return SystemTime.current() + (clk.half_period * self.num_transitions)
+        
+    def next(self): 
+        target_time = self.schedule_time()
+        if target_time is None:
             print("CLK NO CLK")
         else:
-            target_time = SystemTime.current() + (clk.half_period * self.num_transitions)
             time_increment = Clock.get_shortest_event_interval()
+            if Clock.all_run_free():
+                # clocks generated in hardware, all N cycles in one go
+                now = SystemTime.current()
+                num_steps = int((target_time._t_baseunits - now._t_baseunits) // time_increment._t_baseunits) + 1
+                SystemTime.run_free_until(now + time_increment * num_steps)
             #print(f"Is now {SystemTime.current()}, running until {target_time}, increment is {time_increment}")
             while SystemTime.current() <= target_time:
                 SystemTime.advance(time_increment)
@@ -41,6 +54,9 @@ class ClockCycles(Awaitable):
         return self.next()
     
     def __await__(self):
+        if Scheduler.in_task():
+            yield self
+            return self
         try:
             self.next()
         except StopIteration:
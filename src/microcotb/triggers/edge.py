@@ -8,9 +8,13 @@ from microcotb.triggers.awaitable import Awaitable
 from microcotb.clock import Clock
 from microcotb.time.value import TimeValue
 from microcotb.time.system import SystemTime
+from microcotb.scheduler import Scheduler
 
 class Edge(Awaitable):
     DebugTraceLoopCount = 0
+    EdgeValue = None
+    __slots__ = ('_fastest_clock', 'initial_state', 'primed', '_cond_check_count')
+    
     def __init__(self, signal):
         super().__init__()
         self.signal = signal
@@ -44,6 +48,20 @@ class Edge(Awaitable):
             return None
         return self.fastest_clock.half_period
     
+    def schedule_time(self):
+        clk = Clock.get(self.signal)
+        if clk is None or self.EdgeValue is None:
+            # not a clock, will need to be checked
+            return None
+        
+        edge_time = clk.next_toggle
+        if clk.current_signal_value == self.EdgeValue:
+            # next toggle is the wrong way
+            edge_time = edge_time + clk.half_period
+        
+        # toggles happen once time is strictly past next_toggle
+        return edge_time + TimeValue(1, TimeValue.BaseUnits)
+    
     def wait_for_conditions(self):
         step_incr = self.time_increment
         while not self.conditions_met():
@@ -76,12 +94,17 @@ class Edge(Awaitable):
         self._cond_check_count = 0
         self._fastest_clock = None 
         self.prepare_for_wait()
+        if Scheduler.in_task():
+            yield self
+            return self
         self.wait_for_conditions()
         yield
         return self
     
 
 class RisingEdge(Edge):
+    EdgeValue = 1
+    __slots__ = ()
     def __init__(self, signal):
         super().__init__(signal)
             
@@ -104,6 +127,8 @@ class RisingEdge(Edge):
         return f'RisingEdge'
 
 class FallingEdge(Edge):
+    EdgeValue = 0
+    __slots__ = ()
     def __init__(self, signal):
         super().__init__(signal)
             
@@ -9,16 +9,28 @@ from microcotb.triggers.awaitable import Awaitable
 from microcotb.clock import Clock
 from microcotb.time.value import TimeValue
 from microcotb.time.system import SystemTime
+from microcotb.scheduler import Scheduler
 import microcotb.log as logging 
 
 log = logging.getLogger('Timer')
 class Timer(Awaitable):
     DebugTraceLoopCount = 1000
+    __slots__ = ('time',)
+    
     def __init__(self, time:int, units:str):
         super().__init__()
         self.time = TimeValue(time, units)
         
     
+    def schedule_time(self):
+        all_clocks = Clock.all()
+        if not all_clocks or not len(all_clocks):
+            return SystemTime.current() + self.time
+        # wake where stepping through the clocks would have landed
+        time_increment = all_clocks[0].half_period
+        num_steps = int(-(-self.time._t_baseunits // time_increment._t_baseunits))
+        return SystemTime.current() + time_increment * num_steps
+    
     def run_timer(self):
         all_clocks = Clock.all()
         # print(f"All clocks on timer: {all_clocks}")
@@ -29,6 +41,11 @@ class Timer(Awaitable):
         fastest_clock = all_clocks[0]
         time_increment = fastest_clock.half_period
         target_time = SystemTime.current() + self.time
+        if Clock.all_run_free():
+            # clocks are running in hardware, no need to step: just 
+            # land where stepping would have
+            if SystemTime.run_free_until(self.schedule_time()):
+                return 
         increment_count = 0
         while SystemTime.current() < target_time:
             if self.DebugTraceLoopCount and increment_count % self.DebugTraceLoopCount == 0:
@@ -50,6 +67,9 @@ class Timer(Awaitable):
     
     
     def __await__(self):
+        if Scheduler.in_task():
+            yield self
+            return self
         try:
             self.run_timer()
         except StopIteration:
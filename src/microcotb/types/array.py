@@ -5,6 +5,8 @@ from microcotb.types.range import Range
 
 
 class ArrayLike:
+    __slots__ = ()
+    
     @property
     def left(self) -> int:
         """Leftmost index of the array."""
@@ -104,11 +106,11 @@ class Array(ArrayLike):
         if width is not None:
             if range is not None:
                 raise TypeError("Only provide argument to one of 'range' or 'width'")
-            self._range = Range(0, "to", width - 1)
+            self._range = Range.interned(0, "to", width - 1)
         elif range is None:
-            self._range = Range(0, "to", len(self._value) - 1)
+            self._range = Range.interned(0, "to", len(self._value) - 1)
         elif isinstance(range, int):
-            self._range = Range(0, "to", range - 1)
+            self._range = Range.interned(0, "to", range - 1)
         elif isinstance(range, Range):
             self._range = range
         else:
@@ -171,7 +173,7 @@ class Array(ArrayLike):
                     f"slice [{start}:{stop}] direction does not match array direction [{self.left}:{self.right}]"
                 )
             value = self._value[start_i : stop_i + 1]
-            range = Range(start, self.direction, stop)
+            range = Range.interned(start, self.direction, stop)
             return Array(value=value, range=range)
         raise TypeError(f"indexes must be ints or slices, not {type(item).__name__}")
         
@@ -111,7 +111,7 @@ class RangeableObjectMixin(HandleBase):
         left, right, direction = self._handle.get_range()
         if direction == Range.RANGE_NO_DIR:
             raise RuntimeError("Expected range to have a direction but got none!")
-        return Range(left, "to" if direction == Range.RANGE_UP else "downto", right)
+        return Range.interned(left, "to" if direction == Range.RANGE_UP else "downto", right)
 
     @property
     def left(self) -> int:
@@ -137,6 +137,11 @@ class LogicObject(
 ):
     def __init__(self, handle:HandleBase, path:str=None) -> None:
         super().__init__(handle, path)
+        # handles that can give us ints directly (like ports) 
+        # skip the round trip through a binary string
+        self._reads_ints = hasattr(handle, 'get_signal_val_int')
+        # bound once, rather than a new closure for every value read
+        self._set_from_array = self.set
 
     def _set_value(
         self,
@@ -146,9 +151,10 @@ class LogicObject(
     ) -> None:
         value_: str
         if isinstance(value, int):
-            min_val, max_val = _value_limits(len(self), _Limits.VECTOR_NBIT)
+            width = len(self)
+            min_val, max_val = _vector_limits(width)
             if min_val <= value <= max_val:
-                if len(self) <= 32:
+                if width <= 32:
                     schedule_write(
                         self, self._handle.set_signal_val_int, (value,)
                     )
@@ -159,19 +165,19 @@ class LogicObject(
                     value_ = str(
                         LogicArray.from_signed(
                             value,
-                            Range(len(self) - 1, "downto", 0),
+                            Range.interned(width - 1, "downto", 0),
                         )
                     )
                 else:
                     value_ = str(
                         LogicArray.from_unsigned(
                             value,
-                            Range(len(self) - 1, "downto", 0),
+                            Range.interned(width - 1, "downto", 0),
                         )
                     )
             else:
                 raise ValueError(
-                    f"Int value ({value!r}) out of range for assignment of {len(self)!r}-bit signal ({self._name!r})"
+                    f"Int value ({value!r}) out of range for assignment of {width!r}-bit signal ({self._name!r})"
                 )
 
         elif isinstance(value, str):
@@ -201,8 +207,13 @@ class LogicObject(
 
     @property
     def value(self) -> LogicArray:
+        if self._reads_ints:
+            val = self._handle.get_signal_val_int()
+            if val is None:
+                return None
+            return self._handle.value_as_array(val, self._set_from_array)
         binstr = self._handle.get_signal_val_binstr()
-        return LogicArray._from_handle(binstr, on_change=lambda newval: self.set(newval))
+        return LogicArray._from_handle(binstr, on_change=self._set_from_array)
 
     @value.setter
     def value(self, value: LogicArray) -> None:
@@ -261,6 +272,16 @@ class LogicObject(
 def schedule_write_immediate(caller:LogicObject, setter, args):
     setter(args[0])
 
+_vector_limits_by_width = {}
+def _vector_limits(n_bits: int):
+    """(min, max) for assigning ints to n_bits vectors, worked out once per width"""
+    try:
+        return _vector_limits_by_width[n_bits]
+    except KeyError:
+        limits = _value_limits(n_bits, _Limits.VECTOR_NBIT)
+        _vector_limits_by_width[n_bits] = limits
+        return limits
+
 def _value_limits(n_bits: int, limits: _Limits):
     """Calculate min/max for given number of bits and limits class"""
     if limits == _Limits.SIGNED_NBIT:
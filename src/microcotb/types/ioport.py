@@ -8,7 +8,8 @@ Created on Nov 20, 2024
 from microcotb.types.range import Range
 import microcotb.log as logging
 import microcotb.utils.tm as time
-from microcotb.types.logic_array import LogicArray
+from microcotb.types.logic_array import LogicArray, bin_str_table
+from microcotb.time.system import SystemTime
 log = logging.getLogger(__name__)
 
 RangeDirection = Range.RANGE_DOWN
@@ -24,18 +25,176 @@ def range_direction_is_verilog():
     return RangeDirection == Range.RANGE_DOWN
 DefaultResilientDebounceTries = 0
 DefaultDebounceUSecs = 0
+DefaultCacheReads = False
+
+class WritePolicy:
+    IMMEDIATE = 0 # every write goes to the hardware
+    SKIP_UNCHANGED = 1 # writes of the value already on the hardware are dropped
+    DEFERRED = 2 # writes are coalesced, and only go out on the next read, time advance, flush
+                 # or write to the hardware (pin or non-deferred port), whichever comes first
+    
+DefaultWritePolicy = WritePolicy.IMMEDIATE
+
+class Debouncer:
+    '''
+        Reads a port until enough successive values agree, keeping
+        track of how often they didn't and what that cost.
+        
+        With adaptive on, the number of agreeing reads required and 
+        the delay between them are scaled automatically: any 
+        disagreement doubles them (up to MaxTries/MaxDelayUSecs), 
+        CalmReads clean reads in a row ease them back off.  When down to 
+        a single read, which is as cheap as a plain read, one in 
+        ProbeInterval reads gets a second look to notice noise showing up.
+    '''
+    MaxTries = 8
+    MaxDelayUSecs = 200
+    MinDelayStepUSecs = 2
+    CalmReads = 32
+    ProbeInterval = 64
+    
+    __slots__ = ('adaptive', 'tries', 'delay_us', 'reads', 'hardware_reads', 
+                 'disagreements', 'delay_time_us', '_calm', '_until_probe')
+    
+    def __init__(self):
+        self.adaptive = False
+        self.tries = 1
+        self.delay_us = 0
+        self.reads = 0
+        self.hardware_reads = 0
+        self.disagreements = 0
+        self.delay_time_us = 0
+        self._calm = 0
+        self._until_probe = self.ProbeInterval
+        
+    @property 
+    def disagreement_rate(self) -> float:
+        if not self.reads:
+            return 0.0
+        return self.disagreements/self.reads
+    
+    @property 
+    def extra_reads(self) -> int:
+        return self.hardware_reads - self.reads
+    
+    def stats(self) -> dict:
+        return {
+            'reads': self.reads,
+            'hardware_reads': self.hardware_reads,
+            'disagreements': self.disagreements,
+            'disagreement_rate': self.disagreement_rate,
+            'delay_time_us': self.delay_time_us,
+            'tries': self.tries,
+            'delay_us': self.delay_us
+            }
     
+    def reset_stats(self):
+        self.reads = 0
+        self.hardware_reads = 0
+        self.disagreements = 0
+        self.delay_time_us = 0
+        
+    def read(self, signal_read, tries:int, delay_us:int) -> int:
+        '''
+            Read until tries successive values are the same
+        '''
+        self.reads += 1
+        v = signal_read()
+        nreads = 1
+        agreeing = 1
+        disagreed = False
+        while agreeing < tries:
+            if delay_us:
+                time.sleep_us(delay_us)
+                self.delay_time_us += delay_us
+            vnext = signal_read()
+            nreads += 1
+            if vnext == v:
+                agreeing += 1
+            else:
+                disagreed = True
+                v = vnext
+                agreeing = 1
+        self.hardware_reads += nreads
+        if disagreed:
+            self.disagreements += 1
+            if nreads > 2*tries:
+                log.info(f'resilient read {nreads} times (last {v})')
+            else:
+                log.debug(f'resilient read {nreads} times (last {v})')
+        return v
+    
+    def read_adaptive(self, signal_read) -> int:
+        tries = self.tries
+        if tries == 1:
+            self._until_probe -= 1
+            if self._until_probe:
+                self.reads += 1
+                self.hardware_reads += 1
+                return signal_read()
+            self._until_probe = self.ProbeInterval
+            tries = 2
+            
+        noisy = self.disagreements
+        v = self.read(signal_read, tries, self.delay_us)
+        if self.disagreements != noisy:
+            self._calm = 0
+            self.tries = min(self.MaxTries, self.tries*2)
+            self.delay_us = min(self.MaxDelayUSecs, max(self.MinDelayStepUSecs, self.delay_us*2))
+        elif self.tries > 1:
+            self._calm += 1
+            if self._calm >= self.CalmReads:
+                self._calm = 0
+                self.tries -= 1
+                self.delay_us = self.delay_us//2 if self.tries > 1 else 0
+        return v
+    
+    def __repr__(self):
+        mode = 'adaptive' if self.adaptive else 'fixed'
+        return f'<Debouncer {mode} x{self.tries} {self.delay_us}us, {self.disagreements}/{self.reads} noisy>'
+    
+
 class Port:
+    __slots__ = ('name', 'width', 'signal_read', 'signal_write', 'signal_set_bits', 
+                 'signal_write_sequence', 'signal_read_sequence', '_last_value', '_fstr', '_bin_strs', 
+                 'resilientDebounceTries', 'debounceUSecs', 'debouncer', 'cache_reads', 
+                 'cache_hits', '_held_value', '_held_epoch', 'write_policy', 
+                 'write_requests', 'hardware_writes', '_shadow_value', '_pending_value', 
+                 '_dirty')
     
     def __init__(self, name:str, width:int, read_signal_fn=None, write_signal_fn=None):
         self.name = name 
         self.width = width
         self.signal_read = read_signal_fn 
         self.signal_write = write_signal_fn
+        # optional signal_set_bits(mask, value), for backends that can 
+        # natively change only some bits (value is the whole new port value)
+        self.signal_set_bits = None
+        # optional burst transfers, for backends that can do a whole 
+        # sequence, clocking included, in one go (see IO.write_sequence):
+        #   signal_write_sequence(values:list, clock, cycles:int) -> bool
+        #   signal_read_sequence(count:int, clock, cycles:int) -> list
+        # these return False/None only when they can't handle the request 
+        # (nothing sent), a burst that went out but failed raises instead
+        self.signal_write_sequence = None
+        self.signal_read_sequence = None
         self._last_value = 0
         self._fstr = '{v:0' + str(self.width) + 'b}'
+        # narrow ports look their binary strings up
+        self._bin_strs = bin_str_table(self.width)
         self.resilientDebounceTries = DefaultResilientDebounceTries
         self.debounceUSecs = DefaultDebounceUSecs
+        self.debouncer = Debouncer()
+        self.cache_reads = DefaultCacheReads
+        self.cache_hits = 0
+        self._held_value = None
+        self._held_epoch = None
+        self.write_policy = DefaultWritePolicy
+        self.write_requests = 0
+        self.hardware_writes = 0
+        self._shadow_value = None
+        self._pending_value = None
+        self._dirty = False
     
     @property 
     def last_value(self) -> int:
@@ -44,15 +203,30 @@ class Port:
     
     @property 
     def last_value_bin_str(self):
-        return self._fstr.format(v=self._last_value)
+        return self.value_as_bin_str(self._last_value)
     
     def value_as_bin_str(self, v:int):
-        s = self._fstr.format(v=v)
-        # print(f'FMT {self._fstr} and {v} and {s}')
-        return s
+        table = self._bin_strs
+        if table is not None and 0 <= v < len(table):
+            return table[v]
+        return self._fstr.format(v=v)
+    
+    def value_as_array(self, v:int, on_change=None) -> LogicArray:
+        return LogicArray._from_int(v, self.width, on_change)
     
-    def value_as_array(self, v:int) -> LogicArray:
-        return LogicArray._from_handle(self.value_as_bin_str(v))
+    @property 
+    def written_value(self) -> int:
+        '''
+            The value last written to this port (even if it hasn't 
+            actually gone out yet), None if it's never been written.
+        '''
+        if self._dirty:
+            return self._pending_value
+        return self._shadow_value
+    
+    @property 
+    def writes_saved(self) -> int:
+        return self.write_requests - self.hardware_writes
     
     @property 
     def is_readable(self):
@@ -80,9 +254,13 @@ class Port:
         if self.signal_read is None:
             log.error(f'reads not supported on {self.name}')
             return
-        val = self.do_read()
-        fstr = '{v:0' + str(self.width) + 'b}'
-        return fstr.format(v=val)
+        return self.value_as_bin_str(self.do_read())
+    
+    def get_signal_val_int(self):
+        if self.signal_read is None:
+            log.error(f'reads not supported on {self.name}')
+            return
+        return self.do_read()
     
     def get_name_string(self):
         return self.name
@@ -108,36 +286,140 @@ class Port:
             return NotImplemented
         return self.signal_read() == other.signal_read()
     
+    @property 
+    def adaptive_debounce(self) -> bool:
+        return self.debouncer.adaptive
+    
+    @adaptive_debounce.setter 
+    def adaptive_debounce(self, set_to:bool):
+        self.debouncer.adaptive = True if set_to else False
+        
+    @property 
+    def debounce_stats(self) -> dict:
+        st = self.debouncer.stats()
+        if not self.debouncer.adaptive:
+            st['tries'] = max(1, self.resilientDebounceTries)
+            st['delay_us'] = self.debounceUSecs//2
+        return st
+    
     def _do_read_resilient(self):
-        attempt = 0
-        vo = list(range(self.resilientDebounceTries))
-        while vo.count(vo[0]) != len(vo):
-            if attempt:
-                if attempt > 1:
-                    log.info(f'resilient read {attempt} times (last {vo})')
-                else:
-                    log.debug(f'resilient read {attempt} times (last {vo})')
-            attempt += 1
-            for a in range(self.resilientDebounceTries):
-                vo[a] = self.signal_read()            
-                time.sleep(self.debounceUSecs/(2*1e6))
-                
-        return vo[0]
+        if self.debouncer.adaptive:
+            return self.debouncer.read_adaptive(self.signal_read)
+        return self.debouncer.read(self.signal_read, self.resilientDebounceTries, 
+                                   self.debounceUSecs//2)
     
+    def hold_for_step(self, v:int):
+        '''
+            Serve reads from v, without going to the hardware, 
+            until time advances or something gets written.
+        '''
+        self._last_value = v
+        self._held_value = v
+        self._held_epoch = SystemTime.epoch()
+        
     def do_read(self):
-        if self.resilientDebounceTries:
+        if SystemTime._deferred_writes:
+            SystemTime.flush_deferred_writes()
+        if self._held_epoch is not None:
+            if self._held_epoch == SystemTime._step_epoch:
+                self.cache_hits += 1
+                return self._held_value
+            self._held_epoch = None
+            
+        if self.resilientDebounceTries or self.debouncer.adaptive:
             self._last_value = self._do_read_resilient()
         else:
             self._last_value = self.signal_read()
+            
+        if self.cache_reads:
+            # good until time moves or something gets written
+            self._held_value = self._last_value
+            self._held_epoch = SystemTime._step_epoch
         return self._last_value 
     def do_write(self, v):
         self._last_value = v
+        self.write_requests += 1
+        policy = self.write_policy
+        if policy == WritePolicy.IMMEDIATE:
+            self._write_to_hardware(v)
+        elif policy == WritePolicy.SKIP_UNCHANGED:
+            if v != self._shadow_value:
+                self._write_to_hardware(v)
+        else:
+            self._pending_value = v
+            if not self._dirty:
+                self._dirty = True
+                SystemTime.defer_write(self)
+        SystemTime.invalidate_step()
+        
+    def set_bits(self, mask:int, value:int):
+        '''
+            Set only the bits in mask to those in value, leaving the others
+            as they are.  Those come from the port itself if it can be read, 
+            otherwise (or while a deferred write is pending) from what was 
+            last written.
+        '''
+        if self.signal_write is None:
+            log.error(f'writes not supported on {self.name}')
+            return
+        if self._dirty:
+            current = self._pending_value
+        elif self.signal_read is not None:
+            current = self.do_read()
+        else:
+            current = self._shadow_value
+        if current is None:
+            current = self._last_value
+        v = (current & ~mask) | (value & mask)
+        
+        if self.signal_set_bits is None or self.write_policy == WritePolicy.DEFERRED:
+            # deferred writes coalesce into a full write anyway
+            self.do_write(v)
+            return
+        
+        self._last_value = v
+        self.write_requests += 1
+        if self.write_policy != WritePolicy.SKIP_UNCHANGED or v != self._shadow_value:
+            if SystemTime._deferred_writes:
+                SystemTime.flush_deferred_writes()
+            self.signal_set_bits(mask, v)
+            self._shadow_value = v
+            self.hardware_writes += 1
+        SystemTime.invalidate_step()
+        
+    def sequence_written(self, last_value:int, count:int):
+        '''
+            A backend has sent out count values, in a burst, 
+            ending with last_value.
+        '''
+        self._last_value = last_value
+        self._shadow_value = last_value
+        self.write_requests += count
+        self.hardware_writes += count
+        SystemTime.invalidate_step()
+        
+    def _write_to_hardware(self, v):
+        if SystemTime._deferred_writes:
+            # anything written before this goes out before it
+            SystemTime.flush_deferred_writes()
         self.signal_write(v)
-        # print(f"WCH {self._last_value}")
+        self._shadow_value = v
+        self.hardware_writes += 1
+        
+    def flush(self):
+        '''
+            send out any deferred write
+        '''
+        if not self._dirty:
+            return 
+        self._dirty = False
+        if self._pending_value != self._shadow_value:
+            self._write_to_hardware(self._pending_value)
+        
     def do_force_update_last_value(self, v):
         # only for subclasses
         self._last_value = v
 
 
 class IOPort(Port):
-    pass
+    __slots__ = ()
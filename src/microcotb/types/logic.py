@@ -44,14 +44,84 @@ _literal_repr  = {
 
 _str_literals  = {k for k in _literal_repr.keys() if isinstance(k, str)}
 
+# operator results, as literals, indexed [self][other].  These are only
+# used to build the flat tables of Logic instances, below the class
+_and_literals = (
+    # -----------------------------------------------------
+    # U    X    0    1    Z    W    L    H    -       |   |
+    # -----------------------------------------------------
+    ("U", "U", "0", "U", "U", "U", "0", "U", "U"),  # | U |
+    ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | X |
+    ("0", "0", "0", "0", "0", "0", "0", "0", "0"),  # | 0 |
+    ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 1 |
+    ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | Z |
+    ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | W |
+    ("0", "0", "0", "0", "0", "0", "0", "0", "0"),  # | L |
+    ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | H |
+    ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | - |
+)
+
+_or_literals = (
+    # -----------------------------------------------------
+    # U    X    0    1    Z    W    L    H    -       |   |
+    # -----------------------------------------------------
+    ("U", "U", "U", "1", "U", "U", "U", "1", "U"),  # | U |
+    ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | X |
+    ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 0 |
+    ("1", "1", "1", "1", "1", "1", "1", "1", "1"),  # | 1 |
+    ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | Z |
+    ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | W |
+    ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | L |
+    ("1", "1", "1", "1", "1", "1", "1", "1", "1"),  # | H |
+    ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | - |
+)
+
+_xor_literals = (
+    # -----------------------------------------------------
+    # U    X    0    1    Z    W    L    H    -       |   |
+    # -----------------------------------------------------
+    ("U", "U", "U", "U", "U", "U", "U", "U", "U"),  # | U |
+    ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | X |
+    ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 0 |
+    ("U", "X", "1", "0", "X", "X", "1", "0", "X"),  # | 1 |
+    ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | Z |
+    ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | W |
+    ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | L |
+    ("U", "X", "1", "0", "X", "X", "1", "0", "X"),  # | H |
+    ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | - |
+)
+
+_invert_literals = ("U", "X", "1", "0", "X", "X", "1", "0", "X")
+
+_repr_str = ("U", "X", "0", "1", "Z", "W", "L", "H", "-")
+
 
 class Logic:
+    '''
+        One of the nine std_logic states.  There's only ever one 
+        instance per state (Logic('1') is Logic(1)), so these 
+        are cheap to create and compare, and operators are just
+        lookups in flat tables, indexed by self._repr*9 + other._repr
+    '''
+    __slots__ = ('_repr',)
 
     _repr: int
+    
+    # filled in once the class exists, below
+    _instances = ()
+    _from_literal = {}
+    _and_table = ()
+    _or_table = ()
+    _xor_table = ()
+    _invert_table = ()
 
     @classmethod
     def _get_object(cls, _repr: int) -> "Logic":
         """Return the Logic object associated with the repr, enforcing singleton."""
+        return cls._instances[_repr]
+
+    @classmethod
+    def _make_object(cls, _repr: int) -> "Logic":
         self = object.__new__(cls)
         self._repr = _repr
         return self
@@ -61,19 +131,15 @@ class Logic:
         cls,
         value = None,
     ) -> "Logic":
-        """Convert and cache all literals."""
+        """Convert literals to their interned instance."""
         if value is None:
-            _repr = _X
-        else:
-            # convert literal
-            try:
-                _repr = _literal_repr[value]
-            except KeyError:
-                raise ValueError(
-                    f"{value!r} is not convertible to a {cls}"
-                ) from None
-        obj = cls._get_object(_repr)
-        return obj
+            return cls._instances[_X]
+        try:
+            return cls._from_literal[value]
+        except KeyError:
+            raise ValueError(
+                f"{value!r} is not convertible to a {cls}"
+            ) from None
 
     def __new__(
         cls,
@@ -90,84 +156,49 @@ class Logic:
     def __and__(self, other: "Logic") -> "Logic":
         if not isinstance(other, Logic):
             return NotImplemented
-        return Logic(
-            (
-                # -----------------------------------------------------
-                # U    X    0    1    Z    W    L    H    -       |   |
-                # -----------------------------------------------------
-                ("U", "U", "0", "U", "U", "U", "0", "U", "U"),  # | U |
-                ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | X |
-                ("0", "0", "0", "0", "0", "0", "0", "0", "0"),  # | 0 |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 1 |
-                ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | Z |
-                ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | W |
-                ("0", "0", "0", "0", "0", "0", "0", "0", "0"),  # | L |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | H |
-                ("U", "X", "0", "X", "X", "X", "0", "X", "X"),  # | - |
-            )[self._repr][other._repr]
-        )
+        return Logic._and_table[self._repr*9 + other._repr]
 
     def __or__(self: "Logic", other: "Logic") -> "Logic":
         if not isinstance(other, Logic):
             return NotImplemented
-        return Logic(
-            (
-                # -----------------------------------------------------
-                # U    X    0    1    Z    W    L    H    -       |   |
-                # -----------------------------------------------------
-                ("U", "U", "U", "1", "U", "U", "U", "1", "U"),  # | U |
-                ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | X |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 0 |
-                ("1", "1", "1", "1", "1", "1", "1", "1", "1"),  # | 1 |
-                ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | Z |
-                ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | W |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | L |
-                ("1", "1", "1", "1", "1", "1", "1", "1", "1"),  # | H |
-                ("U", "X", "X", "1", "X", "X", "X", "1", "X"),  # | - |
-            )[self._repr][other._repr]
-        )
+        return Logic._or_table[self._repr*9 + other._repr]
 
     def __xor__(self: "Logic", other: "Logic") -> "Logic":
         if not isinstance(other, Logic):
             return NotImplemented
-        return Logic(
-            (
-                # -----------------------------------------------------
-                # U    X    0    1    Z    W    L    H    -       |   |
-                # -----------------------------------------------------
-                ("U", "U", "U", "U", "U", "U", "U", "U", "U"),  # | U |
-                ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | X |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | 0 |
-                ("U", "X", "1", "0", "X", "X", "1", "0", "X"),  # | 1 |
-                ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | Z |
-                ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | W |
-                ("U", "X", "0", "1", "X", "X", "0", "1", "X"),  # | L |
-                ("U", "X", "1", "0", "X", "X", "1", "0", "X"),  # | H |
-                ("U", "X", "X", "X", "X", "X", "X", "X", "X"),  # | - |
-            )[self._repr][other._repr]
-        )
+        return Logic._xor_table[self._repr*9 + other._repr]
 
     def __invert__(self: "Logic") -> "Logic":
-        return Logic(("U", "X", "1", "0", "X", "X", "1", "0", "X")[self._repr])
+        return Logic._invert_table[self._repr]
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            # the usual case, with interned instances
+            return True
         if isinstance(other, Logic):
             return self._repr == other._repr
                 
         elif isinstance(other, (int, str, bool)):
-            try:
-                other = Logic(other)
-            except ValueError:
-                return False
-            return self == other
+            other = Logic._from_literal.get(other)
+            return other is not None and self._repr == other._repr
         else:
             return NotImplemented
+    
+    # copies and unpickling hand back the interned instance
+    def __reduce__(self):
+        return (Logic, (_repr_str[self._repr],))
+    
+    def __copy__(self):
+        return Logic._instances[self._repr]
+    
+    def __deepcopy__(self, memo):
+        return Logic._instances[self._repr]
 
     def __repr__(self) -> str:
         return f"<Logic ({str(self)!r})>"
 
     def __str__(self) -> str:
-        return ("U", "X", "0", "1", "Z", "W", "L", "H", "-")[self._repr]
+        return _repr_str[self._repr]
 
     def __bool__(self) -> bool:
         if self._repr == _0:
@@ -187,3 +218,18 @@ class Logic:
 
     def __index__(self) -> int:
         return int(self)
+
+
+def _build_tables():
+    instances = tuple(Logic._make_object(r) for r in range(len(_repr_str)))
+    Logic._instances = instances
+    Logic._from_literal = {k: instances[v] for k, v in _literal_repr.items()}
+    
+    def flatten(literals):
+        return tuple(instances[_literal_repr[lit]] for row in literals for lit in row)
+    Logic._and_table = flatten(_and_literals)
+    Logic._or_table = flatten(_or_literals)
+    Logic._xor_table = flatten(_xor_literals)
+    Logic._invert_table = flatten((_invert_literals,))
+
+_build_tables()
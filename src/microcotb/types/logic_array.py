@@ -5,23 +5,60 @@
 from math import ceil, log2
 
 from microcotb.types.array import ArrayLike
-from microcotb.types.logic import Logic, _str_literals
+from microcotb.types.logic import Logic, _str_literals, _0
 from microcotb.types.range import Range
 
 def bit_length(val:int):
     return ceil(log2(val+1))
 
+# the (n-1 downto 0) interned Range for each width, 
+# looked up by width alone as that's quickest
+_width_ranges = {}
+def _range_for_width(width:int) -> Range:
+    try:
+        return _width_ranges[width]
+    except KeyError:
+        rng = Range.interned(width - 1, "downto", 0)
+        _width_ranges[width] = rng
+        return rng
+
+# conversions for values this wide, or narrower, are table lookups 
+# (each width has 2**width entries, so keep this small)
+ConversionTableMaxWidth = 8
+_bin_str_tables = {}
+_cached_arrays = {}
+def bin_str_table(width:int) -> list:
+    '''
+        Every width-bit binary string, indexed by value, or None
+        if width is beyond ConversionTableMaxWidth.
+    '''
+    if width > ConversionTableMaxWidth:
+        return None
+    try:
+        return _bin_str_tables[width]
+    except KeyError:
+        fstr = '{v:0' + str(width) + 'b}'
+        table = [fstr.format(v=v) for v in range(1 << width)]
+        _bin_str_tables[width] = table
+        return table
+
 class LogicArray(ArrayLike):
 
-    # These three attribute contain the current value of the array in one or more of
+    # These attribute contain the current value of the array in one or more of
     # three different implementations. This is done for performance reasons, as certain
     # implementations are faster for particular operations.
     # Each implementation can be present, or None if the implementation has not been
     # computed or has been invalidated by a mutating operation.
-    _value_as_array = None
-    _value_as_int = None
-    _value_as_str = None
-    _range: Range = None
+    #
+    # The int implementation is a pair of bitplanes (MSB is the leftmost element):
+    #   _value_as_int: bits that are 1 (or H)
+    #   _unknown_mask: bits that are anything other than 0 or 1
+    # When the mask is 0, which is pretty much always the case for values 
+    # read from actual hardware, the planes are all there is to know and 
+    # indexing, slicing, bitwise ops and comparisons are all big-int ops.  
+    # Otherwise, the str or array is kept around for the details.
+    __slots__ = ('_value_as_array', '_value_as_int', '_unknown_mask', '_value_as_str', 
+                 '_range', '_on_change_callback')
 
     def __init__(
         self,
@@ -33,7 +70,9 @@ class LogicArray(ArrayLike):
     ) -> None:
         self._value_as_array = None
         self._value_as_int = None
+        self._unknown_mask = None
         self._value_as_str = None
+        self._range = None
         self._on_change_callback = on_change
         range = _make_range(range, width)
         if isinstance(value, str):
@@ -47,7 +86,7 @@ class LogicArray(ArrayLike):
                     )
                 self._range = range
             else:
-                self._range = Range(len(self._value_as_str) - 1, "downto", 0)
+                self._range = _range_for_width(len(self._value_as_str))
         elif isinstance(value, int):
             if value < 0:
                 raise ValueError("Invalid int literal")
@@ -59,6 +98,7 @@ class LogicArray(ArrayLike):
                     f"{value!r} will not fit in a LogicArray with bounds: {range!r}."
                 )
             self._value_as_int = value
+            self._unknown_mask = 0
             self._range = range
         elif value is None:
             if range is None:
@@ -74,30 +114,69 @@ class LogicArray(ArrayLike):
                     )
                 self._range = range
             else:
-                self._range = Range(len(self._value_as_array) - 1, "downto", 0)
+                self._range = _range_for_width(len(self._value_as_array))
 
     def _get_array(self) -> list:
         if self._value_as_array is None:
             # May convert int to str before to converting to array.
-            self._value_as_array = [Logic(v) for v in self._get_str()]
+            from_literal = Logic._from_literal
+            self._value_as_array = [from_literal[v] for v in self._get_str()]
         return self._value_as_array
 
     def _get_str(self) -> str:
         if self._value_as_str is None:
-            if self._value_as_int is not None:
-                fstr = '{val:0' + str(len(self)) + 'b}'
-                self._value_as_str = fstr.format(val=self._value_as_int)
+            if self._value_as_array is None:
+                # only ever the case when the planes say everything
+                width = len(self)
+                if width <= ConversionTableMaxWidth:
+                    self._value_as_str = bin_str_table(width)[self._value_as_int]
+                else:
+                    fstr = '{val:0' + str(width) + 'b}'
+                    self._value_as_str = fstr.format(val=self._value_as_int)
             else:
                 self._value_as_str = "".join(
                     str(v) for v in list(self._value_as_array)
                 )
         return self._value_as_str
 
-    def _get_int(self) -> int:
+    def _get_planes(self):
+        '''
+            The (value, unknown) bitplanes, 
+            computed from the str if required.
+        '''
         if self._value_as_int is None:
             # May convert list to str before converting to int.
-            self._value_as_int = int(self._get_str(), 2)
-        return self._value_as_int
+            s = self._get_str()
+            value = None
+            if not len(s):
+                value = 0
+            elif '-' not in s: # int() would take that as a sign
+                try:
+                    value = int(s, 2)
+                except ValueError:
+                    pass
+            
+            if value is not None:
+                unknown = 0
+            else:
+                # map the states onto 0/1 for each plane, replace()
+                # is much quicker than going char by char
+                value_str = s.replace('H', '1')
+                unknown_str = s.replace('0', '_').replace('1', '_')
+                for c in 'UXZWLH-':
+                    value_str = value_str.replace(c, '0')
+                    unknown_str = unknown_str.replace(c, '1')
+                value = int(value_str, 2)
+                unknown = int(unknown_str.replace('_', '0'), 2)
+            self._value_as_int = value
+            self._unknown_mask = unknown
+        return (self._value_as_int, self._unknown_mask)
+
+    def _get_int(self) -> int:
+        value, unknown = self._get_planes()
+        if unknown:
+            raise ValueError(f"{self!r} is not resolvable to an int")
+        return value
 
     @classmethod
     def from_unsigned(
@@ -147,7 +226,7 @@ class LogicArray(ArrayLike):
     ) -> "LogicArray":
         range = _make_range(range, width)
         if range is None:
-            range = Range(len(value) * 8 - 1, "downto", 0)
+            range = _range_for_width(len(value) * 8)
         elif len(value) * 8 != len(range):
             raise OverflowError(
                 f"Value of length {len(value)} will not fit in a LogicArray with bounds: {range!r}"
@@ -164,11 +243,38 @@ class LogicArray(ArrayLike):
         self = super().__new__(cls)
         self._value_as_array = None
         self._value_as_int = None
+        self._unknown_mask = None
         self._value_as_str = value
         self._on_change_callback = on_change
-        self._range = Range(len(value) - 1, "downto", 0)
+        self._range = _range_for_width(len(value))
         return self
 
+    @classmethod
+    def _from_int(cls, value: int, width: int, on_change=None) -> "LogicArray":
+        # Like _from_handle, but for ints read from ports, which
+        # are expected to fit in width bits.  No str is built unless
+        # it's asked for.  Narrow values nobody will be writing back 
+        # through are shared, read-only, instances.
+        if on_change is None and width <= ConversionTableMaxWidth and 0 <= value < (1 << width):
+            return _cached_array(value, width)
+        return cls._from_planes(value, _range_for_width(width), on_change)
+
+    @classmethod
+    def _from_planes(cls, value: int, range: Range, on_change=None) -> "LogicArray":
+        # A fully resolved value (only 0s and 1s), that's known 
+        # to fit in range.
+        self = super().__new__(cls)
+        self._value_as_array = None
+        self._value_as_int = value
+        self._unknown_mask = 0
+        self._value_as_str = None
+        self._on_change_callback = on_change
+        self._range = range
+        return self
+
+    def _resolved_planes(self) -> bool:
+        return self._value_as_int is not None and not self._unknown_mask
+
     @property
     def range(self) -> Range:
         """:class:`Range` of the indexes of the array."""
@@ -213,15 +319,15 @@ class LogicArray(ArrayLike):
             # Prefers checking against str vs any type since that is going to be the
             #   most common type and also the "middle" type for conversions.
             # Always converts away from ints to prevent issues with non-0/1 data.
-            if self._value_as_str is not None and other._value_as_str is not None:
+            if self._resolved_planes() and other._resolved_planes():
+                # (INT, INT)
+                return self._value_as_int == other._value_as_int
+            elif self._value_as_str is not None and other._value_as_str is not None:
                 # (STR, STR)
                 return self._value_as_str == other._value_as_str
             elif self._value_as_array is not None and other._value_as_array is not None:
                 # (ARRAY, ARRAY)
                 return self._value_as_array == other._value_as_array
-            elif self._value_as_int is not None and other._value_as_int is not None:
-                # (INT, INT)
-                return self._value_as_int == other._value_as_int
             elif self._value_as_str is not None:
                 # (STR, INT)
                 # (STR, ARRAY)
@@ -230,12 +336,10 @@ class LogicArray(ArrayLike):
                 # (INT, STR)
                 # (ARRAY, STR)
                 return self._get_str() == other._value_as_str
-            elif self._value_as_array is not None:
-                # (ARRAY, INT)
-                return self._value_as_array == other._get_array()
             else:
+                # (ARRAY, INT)
                 # (INT, ARRAY)
-                return self._get_array() == other._value_as_array
+                return self._get_planes() == other._get_planes()
         elif isinstance(other, (list, tuple)):
             try:
                 other = LogicArray(other)
@@ -284,7 +388,7 @@ class LogicArray(ArrayLike):
     @property
     def is_resolvable(self) -> bool:
         """``True`` if all elements are ``0`` or ``1``."""
-        return all(bit in (Logic(0), Logic(1)) for bit in self)
+        return self._get_planes()[1] == 0
 
     def to_unsigned(self) -> int:
         if len(self) == 0:
@@ -308,10 +412,14 @@ class LogicArray(ArrayLike):
         return self.to_unsigned().to_bytes(ceil(len(self) / 8), byteorder)
 
     def __getitem__(self, item):
-        array = self._get_array()
         if isinstance(item, int):
             idx = self._translate_index(item)
-            return array[idx]
+            if self._resolved_planes():
+                bit = (self._value_as_int >> (len(self) - 1 - idx)) & 1
+                return Logic._instances[_0 + bit]
+            if self._value_as_str is not None:
+                return Logic._from_literal[self._value_as_str[idx]]
+            return self._get_array()[idx]
         elif isinstance(item, slice):
             start = item.start if item.start is not None else self.left
             stop = item.stop if item.stop is not None else self.right
@@ -323,8 +431,17 @@ class LogicArray(ArrayLike):
                 raise IndexError(
                     f"slice [{start}:{stop}] direction does not match array direction [{self.left}:{self.right}]"
                 )
-            value = array[start_i : stop_i + 1]
-            range = Range(start, self.direction, stop)
+            range = Range.interned(start, self.direction, stop)
+            if self._resolved_planes():
+                width = stop_i - start_i + 1
+                value = (self._value_as_int >> (len(self) - 1 - stop_i)) & ((1 << width) - 1)
+                return LogicArray._from_planes(value, range, self._on_change_callback)
+            if self._value_as_str is not None:
+                sliced = LogicArray._from_handle(self._value_as_str[start_i : stop_i + 1], 
+                                                 self._on_change_callback)
+                sliced._range = range
+                return sliced
+            value = self._get_array()[start_i : stop_i + 1]
             return LogicArray(value=value, range=range, on_change=self._on_change_callback)
         raise TypeError(f"indexes must be ints or slices, not {type(item).__name__}")
 
@@ -333,13 +450,14 @@ class LogicArray(ArrayLike):
         item,
         value,
     ) -> None:
-        array = self._get_array()
-        # invalid other impls
-        self._value_as_str = None
-        self._value_as_int = None
         if isinstance(item, int):
             idx = self._translate_index(item)
-            array[idx] = Logic(value)
+            value = Logic(value)
+            if self._resolved_planes() and value._repr in (_0, _0 + 1):
+                self._set_bits(idx, idx, value._repr - _0)
+            else:
+                self._get_array()[idx] = value
+                self._array_changed()
         elif isinstance(item, slice):
             start = item.start if item.start is not None else self.left
             stop = item.stop if item.stop is not None else self.right
@@ -355,19 +473,27 @@ class LogicArray(ArrayLike):
             slice_width = (stop_i - start_i + 1)
             if isinstance(value, int):
                 if value < 0:
-                    value_as_logics = list(LogicArray.from_signed(value, width=slice_width))
+                    value_as_logics = LogicArray.from_signed(value, width=slice_width)
+                else:
+                    value_as_logics = LogicArray.from_unsigned(value, width=slice_width)
+                    
+                if self._resolved_planes():
+                    self._set_bits(start_i, stop_i, value_as_logics._value_as_int)
+                    value_as_logics = None
                 else:
-                    value_as_logics = list(LogicArray.from_unsigned(value, width=slice_width))
+                    value_as_logics = list(value_as_logics)
             else:
                 value_as_logics = [
                     Logic(v) for v in iter(value)
                 ]
                 
-            if len(value_as_logics) != slice_width:
-                raise ValueError(
-                    f"value of length {len(value_as_logics)!r} will not fit in slice [{start}:{stop}]"
-                )
-            array[start_i : stop_i + 1] = value_as_logics
+            if value_as_logics is not None:
+                if len(value_as_logics) != slice_width:
+                    raise ValueError(
+                        f"value of length {len(value_as_logics)!r} will not fit in slice [{start}:{stop}]"
+                    )
+                self._get_array()[start_i : stop_i + 1] = value_as_logics
+                self._array_changed()
         else:
             raise TypeError(
                 f"indexes must be ints or slices, not {type(item).__name__}"
@@ -376,6 +502,20 @@ class LogicArray(ArrayLike):
         if self._on_change_callback is not None:
             self._on_change_callback(self)
 
+    def _set_bits(self, start_i:int, stop_i:int, value:int):
+        # splice value into the (resolved) planes, at array indices start_i..stop_i
+        shift = len(self) - 1 - stop_i
+        mask = ((1 << (stop_i - start_i + 1)) - 1) << shift
+        self._value_as_int = (self._value_as_int & ~mask) | ((value << shift) & mask)
+        self._value_as_str = None
+        self._value_as_array = None
+
+    def _array_changed(self):
+        # invalid other impls
+        self._value_as_str = None
+        self._value_as_int = None
+        self._unknown_mask = None
+
     def _translate_index(self, item: int) -> int:
         try:
             return self._range.index(item)
@@ -408,7 +548,7 @@ class LogicArray(ArrayLike):
             raise ValueError(
                 "cannot perform bitwise & "
             )
-        return LogicArray(a & b for a, b in zip(self, other))
+        return self._bitwise(other, lambda a, b: a & b, Logic._and_table)
 
     def __or__(self, other: "LogicArray") -> "LogicArray":
         if isinstance(other, int):
@@ -419,7 +559,7 @@ class LogicArray(ArrayLike):
             raise ValueError(
                 f"cannot perform bitwise | "
             )
-        return LogicArray(a | b for a, b in zip(self, other))
+        return self._bitwise(other, lambda a, b: a | b, Logic._or_table)
 
     def __xor__(self, other: "LogicArray") -> "LogicArray":
         if isinstance(other, int):
@@ -430,24 +570,68 @@ class LogicArray(ArrayLike):
             raise ValueError(
                 f"cannot perform bitwise ^ "
             )
-        return LogicArray(a ^ b for a, b in zip(self, other))
+        return self._bitwise(other, lambda a, b: a ^ b, Logic._xor_table)
+
+    def _bitwise(self, other: "LogicArray", int_op, table) -> "LogicArray":
+        value_a, unknown_a = self._get_planes()
+        value_b, unknown_b = other._get_planes()
+        if not (unknown_a or unknown_b):
+            return LogicArray._from_planes(int_op(value_a, value_b), 
+                                           _range_for_width(len(self)))
+        # something in there isn't a 0/1, go bit by bit
+        return LogicArray(table[a._repr*9 + b._repr] for a, b in zip(self, other))
 
     def __invert__(self) -> "LogicArray":
+        value, unknown = self._get_planes()
+        if not unknown:
+            return LogicArray._from_planes(value ^ ((1 << len(self)) - 1), 
+                                           _range_for_width(len(self)))
         return LogicArray(~v for v in self)
 
     def __bool__(self) -> bool:
-        return any(v in (Logic("H"), Logic("1")) for v in self)
+        # the value plane has the H bits as well
+        return self._get_planes()[0] != 0
 
 
+class _CachedLogicArray(LogicArray):
+    '''
+        A LogicArray shared by everyone asking for the same 
+        narrow value, so it can't be modified.
+    '''
+    __slots__ = ()
+    
+    @property
+    def range(self) -> Range:
+        return self._range
+    
+    @range.setter
+    def range(self, new_range: Range) -> None:
+        raise TypeError("cached LogicArray values are read-only")
+    
+    def __setitem__(self, item, value) -> None:
+        raise TypeError("cached LogicArray values are read-only")
+
+def _cached_array(value:int, width:int) -> LogicArray:
+    try:
+        table = _cached_arrays[width]
+    except KeyError:
+        table = [None]*(1 << width)
+        _cached_arrays[width] = table
+    arr = table[value]
+    if arr is None:
+        arr = _CachedLogicArray._from_planes(value, _range_for_width(width))
+        table[value] = arr
+    return arr
+
 def _make_range(
     range, width #  Union[int, None]
     ):
     if width is not None:
         if range is not None:
             raise TypeError("Only provide argument to one of 'range' or 'width'")
-        return Range(width - 1, "downto", 0)
+        return _range_for_width(width)
     elif isinstance(range, int):
-        return Range(range - 1, "downto", 0)
+        return _range_for_width(range)
     elif range is None or isinstance(range, Range):
         return range
     else:
@@ -2,6 +2,8 @@
 # Licensed under the Revised BSD License, see LICENSE for details.
 # SPDX-License-Identifier: BSD-3-Clause
 
+_interned = {}
+
 class Range:
     RANGE_DOWN = -1
     RANGE_NO_DIR = 0
@@ -28,6 +30,18 @@ class Range:
             raise TypeError("invalid arguments")
         self._range = range(start, stop, step)
 
+    @classmethod
+    def interned(cls, left: int, direction: str, right: int) -> "Range":
+        """A shared Range for these bounds: they're never modified, so
+        there's no need to build one each time."""
+        key = (left, direction, right)
+        try:
+            return _interned[key]
+        except KeyError:
+            rng = cls(left, direction, right)
+            _interned[key] = rng
+            return rng
+
     @classmethod
     def from_range(cls, range: range) -> "Range":
         """Convert :class:`range` to :class:`Range`."""
@@ -88,9 +102,13 @@ class Range:
     def __repr__(self) -> str:
         return f"{type(self).__qualname__}({self.left!r}, {self.direction!r}, {self.right!r})"
 
-    # index = cached_method(Sequence.index)
     def index(self, idx:int) -> int:
-        return list(self._range).index(idx)
+        # straight arithmetic, ranges are contiguous
+        rng = self._range
+        pos = (idx - rng.start) * rng.step
+        if 0 <= pos < len(rng):
+            return pos
+        raise ValueError(f"{idx} is not in range")
 
 def _guess_step(left: int, right: int) -> int:
     if left <= right:
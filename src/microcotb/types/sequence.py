@@ -0,0 +1,165 @@
+'''
+Created on Oct 19, 2026
+
+Sequences of port values, as streamed through ports with
+IO.write_sequence() and read_sequence().
+
+When NumPy is available, the values are kept in an array and
+prepared (checked, two's complemented, masked) in one vectorized
+go.  Otherwise, and always on MicroPython, it's a list of ints.
+Either way, elements come out as ints when iterating and as
+LogicArrays when indexed, like a port's value.
+
+    seq = ValueSequence(b'hello', 8)
+    seq[0]          # <LogicArray('01101000', Range(7, 'downto', 0))>
+    seq.tolist()    # [104, 101, 108, 108, 111]
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+from microcotb.types.logic_array import LogicArray
+
+# NumPy is only imported when a sequence is first made,
+# it's much too heavy to pull in with everything else
+_numpy = None
+_numpy_checked = False
+UseNumPy = True
+
+def numpy_module():
+    '''
+        The numpy module, or None if it's unavailable (or UseNumPy is off)
+    '''
+    global _numpy, _numpy_checked
+    if not UseNumPy:
+        return None
+    if not _numpy_checked:
+        _numpy_checked = True
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = None
+    return _numpy
+
+
+def _smallest_dtype(np, width:int):
+    if width <= 8:
+        return np.uint8
+    if width <= 16:
+        return np.uint16
+    if width <= 32:
+        return np.uint32
+    return np.uint64
+
+
+class ValueSequence:
+    '''
+        A number of values for a width-bit port.
+
+        Values may be ints (negatives are taken as two's complement,
+        like when setting a port's value), LogicArrays, bytes/bytearray
+        or a NumPy array.
+    '''
+    __slots__ = ('width', '_values')
+
+    def __init__(self, values, width:int):
+        self.width = width
+        if isinstance(values, ValueSequence):
+            if values.width != width:
+                values = values.tolist()
+            else:
+                self._values = values._values
+                return
+
+        np = numpy_module()
+        if np is not None and width <= 63:
+            self._values = self._prepare_numpy(np, values)
+        else:
+            self._values = self._prepare_list(values)
+
+    def _out_of_range(self, v):
+        return ValueError(f"Value ({v!r}) out of range for {self.width}-bit port")
+
+    def _prepare_list(self, values) -> list:
+        min_val = -(1 << (self.width - 1))
+        mask = (1 << self.width) - 1
+        prepared = []
+        for v in values:
+            v = int(v)
+            if v < min_val or v > mask:
+                raise self._out_of_range(v)
+            prepared.append(v & mask)
+        return prepared
+
+    def _prepare_numpy(self, np, values):
+        if isinstance(values, (bytes, bytearray)):
+            arr = np.frombuffer(values, dtype=np.uint8).astype(np.int64)
+        elif isinstance(values, np.ndarray):
+            arr = values.astype(np.int64).reshape(-1)
+        else:
+            if not isinstance(values, (list, tuple)):
+                values = list(values)
+            if len(values) and not isinstance(values[0], (int, np.integer)):
+                # LogicArrays and such (which numpy would see as sequences)
+                values = list(map(int, values))
+            arr = np.asarray(values, dtype=np.int64).reshape(-1)
+
+        if arr.size:
+            lowest = int(arr.min())
+            highest = int(arr.max())
+            if lowest < -(1 << (self.width - 1)):
+                raise self._out_of_range(lowest)
+            if highest > (1 << self.width) - 1:
+                raise self._out_of_range(highest)
+        return (arr & ((1 << self.width) - 1)).astype(_smallest_dtype(np, self.width))
+
+    @property
+    def uses_numpy(self) -> bool:
+        return not isinstance(self._values, list)
+
+    def tolist(self) -> list:
+        if self.uses_numpy:
+            return self._values.tolist()
+        return list(self._values)
+
+    def to_numpy(self):
+        np = numpy_module()
+        if np is None:
+            raise RuntimeError('NumPy is not available')
+        if self.uses_numpy:
+            return self._values
+        return np.asarray(self._values, dtype=_smallest_dtype(np, self.width) if self.width <= 64 else object)
+
+    def to_bytes(self) -> bytes:
+        if self.width > 8:
+            raise ValueError(f'{self.width}-bit values do not fit in bytes')
+        if self.uses_numpy:
+            return self._values.tobytes()
+        return bytes(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            sub = ValueSequence.__new__(ValueSequence)
+            sub.width = self.width
+            sub._values = self._values[item]
+            return sub
+        return LogicArray._from_int(int(self._values[item]), self.width)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ValueSequence):
+            other = other.tolist()
+        elif isinstance(other, (bytes, bytearray)):
+            other = list(other)
+        elif not isinstance(other, (list, tuple)):
+            return NotImplemented
+        return self.tolist() == list(other)
+
+    def __repr__(self):
+        impl = 'numpy' if self.uses_numpy else 'list'
+        return f'<ValueSequence {len(self)} x {self.width} bits ({impl})>'
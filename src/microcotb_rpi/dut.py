@@ -5,8 +5,8 @@ Created on Dec 7, 2024
 @copyright: Copyright (C) 2024 Pat Deegan, https://psychogenic.com
 '''
 import microcotb.utils.tm as time
-from .io import RPiIO
-from microcotb.time.value import TimeValue
+from .io import RPiIO, LineBank
+from microcotb.time.value import TimeValue, TimeConverter
 from microcotb.time.system import SystemTime
 
 
@@ -26,6 +26,39 @@ class Direction:
     CONFIGURABLE = 2
     
 
+class KernelTimeCalibration:
+    '''
+        Maps the kernel's edge event timestamps (monotonic ns) onto 
+        the SystemTime axis.
+        
+        Each calibrate() anchors "now" on the kernel clock to "now" in 
+        system time: events are placed as far back from that anchor as
+        they actually occurred, but never before the previous 
+        anchor (or anything else already reported), so the timeline 
+        stays in order.
+    '''
+    def __init__(self):
+        self.offset_ns = None 
+        self._floor = 0
+        self._now = 0
+        
+    def calibrate(self, not_before:TimeValue=None):
+        self._floor = self._now
+        self._now = SystemTime.current().time_in(TimeValue.BaseUnits)
+        if not_before is not None:
+            self._floor = max(self._floor, not_before.time_in(TimeValue.BaseUnits))
+        self.offset_ns = time.monotonic_ns() - TimeConverter.rescale(self._now, TimeValue.BaseUnits, 'ns')
+        
+    def to_system_time(self, timestamp_ns:int) -> TimeValue:
+        t = TimeConverter.rescale(timestamp_ns - self.offset_ns, 'ns', TimeValue.BaseUnits)
+        if t < self._floor:
+            t = self._floor
+        elif t > self._now:
+            t = self._now
+        self._floor = t
+        return TimeValue(round(t), TimeValue.BaseUnits)
+
+
 class DUT(MonitorableDUT):
     def __init__(self, name:str='PiDUT', 
                  state_change_callback=None,
@@ -33,6 +66,103 @@ class DUT(MonitorableDUT):
         super().__init__(name, state_change_callback)
         self.configurable_port_suffix = configurable_port_suffix
         self._port_with_inputs = []
+        self._line_banks = dict()
+        # when monitoring, keep every edge the kernel reports, with 
+        # its timestamp, rather than just reading the new value
+        self.capture_edge_events = False
+        self.kernel_time = KernelTimeCalibration()
+        # when monitoring tests, have edge events gathered by a 
+        # thread per chip, and handled at each step, rather than 
+        # waited on after every write
+        self.use_event_pump = True
+        self._pumping_events = False
+        # optionally, while tests run, batch I/O within a step into
+        # single get/set calls, per chip.  Off by default: it saves 
+        # calls, but hasn't been shown to be faster (see 
+        # examples/raspi/bench_io.py)
+        self.batch_step_io = False
+        
+    def line_bank(self, iochipname:str="/dev/gpiochip0") -> LineBank:
+        if iochipname not in self._line_banks:
+            self._line_banks[iochipname] = LineBank(iochipname)
+        return self._line_banks[iochipname]
+    
+    @property 
+    def line_banks(self) -> list:
+        return list(self._line_banks.values())
+    
+    def testing_will_begin(self):
+        super().testing_will_begin()
+        for bank in self.line_banks:
+            bank.batching = self.batch_step_io
+        if self.use_event_pump and self.is_monitoring:
+            self.start_event_pumps()
+            
+    def testing_done(self):
+        self.stop_event_pumps()
+        for bank in self.line_banks:
+            bank.flush()
+            bank.batching = False
+        super().testing_done()
+        
+    @property 
+    def event_pumps_running(self) -> bool:
+        return self._pumping_events
+        
+    def start_event_pumps(self):
+        '''
+            Gather input edge events in the background, for every 
+            chip, and handle them whenever time advances.
+        '''
+        if self._pumping_events:
+            return 
+        self._pumping_events = True
+        for bank in self.line_banks:
+            bank.start_event_pump()
+        SystemTime.add_step_listener(self.drain_input_events)
+        
+    def stop_event_pumps(self):
+        if not self._pumping_events:
+            return 
+        SystemTime.remove_step_listener(self.drain_input_events)
+        for bank in self.line_banks:
+            bank.stop_event_pump()
+        self._pumping_events = False
+        # whatever was still in flight
+        self.drain_input_events()
+        
+    def drain_input_events(self):
+        '''
+            Report what the event pumps have collected.
+            Nothing here blocks or touches the lines.
+        '''
+        if not self.is_monitoring:
+            return 
+        if self.capture_edge_events:
+            return self.capture_input_events()
+        for io in self._port_with_inputs:
+            evts = io.take_edge_events()
+            if not len(evts):
+                continue
+            # the final value is all we need, and the events give us that
+            values = io.edge_event_values(evts, self._known_value(io))
+            self._report_and_cache(io, values[-1][1])
+        
+    def read_all(self) -> dict:
+        '''
+            Read every line in a single call per chip, 
+            and hand out the values to the ports.
+        '''
+        SystemTime.flush_deferred_writes()
+        bank_values = dict(map(lambda b: (b.chipname, b.get_all_values()), self.line_banks))
+        vals = dict()
+        for io in self.available_io():
+            if not isinstance(io, RPiIO) or io.name in vals:
+                continue
+            v = io.value_from_lines(bank_values[io.bank.chipname])
+            io.port.do_force_update_last_value(v)
+            vals[io.name] = v
+        return vals
 
     @property 
     def is_monitoring(self):
@@ -58,6 +188,8 @@ class DUT(MonitorableDUT):
                 self._port_with_inputs.append(io)
                     
     def poll_for_input_events(self, skip_io:MonitorableIO=None):
+        if self.capture_edge_events and self.is_monitoring:
+            return self.capture_input_events(skip_io)
         
         for iowithinput in self._port_with_inputs:
             if (skip_io is None or skip_io != iowithinput):
@@ -69,13 +201,37 @@ class DUT(MonitorableDUT):
 
                     
         
-    def _report_and_cache(self, io:MonitorableIO, value):
+    def capture_input_events(self, skip_io:MonitorableIO=None):
+        '''
+            Queue a state change for every edge event, at the time 
+            it happened.
+        '''
+        last_queued = None 
+        if len(self.queued_state_changes):
+            last_queued = self.queued_state_changes[-1][0]
+        self.kernel_time.calibrate(last_queued)
+        for io in self._port_with_inputs:
+            if skip_io is io:
+                continue 
+            evts = io.take_edge_events()
+            if not len(evts):
+                continue 
+            for ts, value in io.edge_event_values(evts, self._known_value(io)):
+                self._report_and_cache(io, value, self.kernel_time.to_system_time(ts))
+                
+    def _known_value(self, io:RPiIO):
+        if self.state_cache.has(io.port.name):
+            return self.state_cache.get(io.port.name)
+        return io.last_value
+                
+        
+    def _report_and_cache(self, io:MonitorableIO, value, at_time:TimeValue=None):
         if not self.is_monitoring:
             return 
         if not self.state_cache.has(io.port.name) or \
             self.state_cache.get(io.port.name) != value:
             stch = StateChangeReport()
-            self.append_state_change(stch.add_change(io.port.name, value))
+            self.append_state_change(stch.add_change(io.port.name, value), at_time)
             self.state_cache.set(io.port.name, value)
             
         
@@ -84,6 +240,13 @@ class DUT(MonitorableDUT):
     def _io_val_written_cb(self, io:MonitorableIO, value_written):
         if not self.is_monitoring:
             return 
+        if self._pumping_events:
+            # inputs get handled when time moves, nothing to wait on here
+            self._report_and_cache(io, value_written)
+            return 
+        if self.capture_edge_events:
+            # get whatever happened up to now in ahead of this write
+            self.capture_input_events(io)
         self._report_and_cache(io, value_written)
         self.poll_for_input_events(io)
     def _convert_to_list(self, val, valid_types, error_msg:str):
@@ -129,7 +292,7 @@ class DUT(MonitorableDUT):
         if hasattr(self, name):
             raise RuntimeError(f'Already have something called "{name}" in here')
         
-        io = RPiIO(name, pin_list, iochipname)
+        io = RPiIO(name, pin_list, iochipname, self.line_bank(iochipname))
         setattr(self, name, io)
         if direction == Direction.INPUT:
             io.oe.value = 0
@@ -7,6 +7,7 @@ Created on Dec 7, 2024
 from microcotb.monitorable.io import IO, MonitorableIO
 from microcotb.dut import SliceWrapper
 from microcotb.types.ioport import DefaultDebounceUSecs
+from microcotb.time.system import SystemTime
 import microcotb.log as logging
 log = logging.getLogger(__name__)
 
@@ -20,7 +21,41 @@ except ModuleNotFoundError as e:
     raise e
     
 import datetime 
+import collections
+import os
+import select
+import threading
  
+# Values for each bit of a byte, LSB first, so 
+# ByteValues[0x05] is (ACTIVE, INACTIVE, ACTIVE, INACTIVE...)
+ByteValues = tuple(map(lambda b: tuple(map(lambda i: Value.ACTIVE if b & (1 << i) else Value.INACTIVE, 
+                                           range(8))), range(256)))
+
+# Lookups below are keyed by id() because hashing 
+# enum members goes through python-level code, which is slow
+ValueBitChar = {id(Value.ACTIVE): ord('1'), id(Value.INACTIVE): ord('0')}
+MaxPackTableWidth = 8
+_PackTables = dict()
+
+def pack_table(width:int) -> dict:
+    '''
+        For narrow ports, a map of all possible line values (as 
+        ids, MSB first) to the int they represent
+    '''
+    if width not in _PackTables:
+        table = dict()
+        for v in range(1 << width):
+            table[tuple(map(id, reversed(ByteValues[v][:width])))] = v
+        _PackTables[width] = table
+    return _PackTables[width]
+
+def pack_values(vals, table:dict=None) -> int:
+    '''
+        Line values, MSB first, to an int
+    '''
+    if table is not None:
+        return table[tuple(map(id, vals))]
+    return int(bytes(map(ValueBitChar.__getitem__, map(id, vals))), 2)
 
 
 class ConfigurableDirectionIO(IO):
@@ -29,12 +64,277 @@ class ConfigurableDirectionIO(IO):
         pass
 
 
+class EdgeEventPump:
+    '''
+        A thread that sits blocked on a line request's file descriptor 
+        and moves edge events, as they arrive, into a deque.
+        
+        The deque is the only thing shared: the pump only ever appends
+        and the consumer only pops, both of which are atomic, so there's 
+        no locking and nothing is waited on when draining.
+    '''
+    def __init__(self, request:gpiod.LineRequest, name:str='edge-events'):
+        self.events = collections.deque()
+        self._request = request
+        self._name = name
+        self._running = False
+        self._thread = None
+        self._wake_r = None
+        self._wake_w = None
+        
+    @property 
+    def running(self) -> bool:
+        return self._running
+    
+    def start(self):
+        if self._running:
+            return 
+        self._wake_r, self._wake_w = os.pipe()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        
+    def stop(self):
+        if not self._running:
+            return 
+        self._running = False
+        os.write(self._wake_w, b'x')
+        self._thread.join()
+        self._thread = None
+        os.close(self._wake_r)
+        os.close(self._wake_w)
+        
+    def drain(self) -> list:
+        '''
+            Everything received up to now, never blocks
+        '''
+        evts = []
+        popper = self.events.popleft
+        while len(self.events):
+            evts.append(popper())
+        return evts
+    
+    def _run(self):
+        req_fd = self._request.fd
+        poller = select.poll()
+        poller.register(req_fd, select.POLLIN)
+        poller.register(self._wake_r, select.POLLIN)
+        while self._running:
+            for fd, _evt in poller.poll():
+                if fd == req_fd:
+                    self.events.extend(self._request.read_edge_events())
+    
+    def __repr__(self):
+        state = 'running' if self._running else 'stopped'
+        return f'<EdgeEventPump {self._name} {state}>'
+
+
+class LineBank:
+    '''
+        All the lines used on a GPIO chip, by any number of ports, 
+        held in a single gpiod line request.
+        
+        When batching, which the DUT turns on while running tests 
+        if its batch_step_io is set, 
+          * all lines are read in one go, once per step, with ports 
+            picking out their bits from that (except debounced 
+            reads, which need to see the lines each time); and
+          * writes are collected and go out in a single set_values(), 
+            before anything is read or time moves on.
+        
+        Otherwise, everything goes straight to the lines.
+        
+        With the event pump on, edge events are gathered in the background
+        and collect_events() just picks up whatever has come in so far.
+    '''
+    def __init__(self, chipname:str="/dev/gpiochip0"):
+        self.chipname = chipname
+        self.batching = False
+        self._settings = dict()
+        self._offsets = []
+        self._output_values = dict()
+        self._request = None
+        self._stale = False
+        self._values = None # list, in order of offsets
+        self._values_epoch = None
+        self._pending = dict()
+        self._events = dict()
+        self._pump = None
+        self._pumping = False
+        
+    @property 
+    def offsets(self) -> list:
+        return self._offsets
+    
+    @property 
+    def request(self) -> gpiod.LineRequest:
+        if self._request is None or self._stale:
+            self._make_request()
+        return self._request
+    
+    def add_lines(self, config:dict):
+        '''
+            Add lines, a dict of offset: LineSettings, to the bank.  
+            This means a new request covering everything, which happens
+            on next access.
+        '''
+        for offset in config.keys():
+            if offset in self._settings:
+                raise RuntimeError(f'Line {offset} on {self.chipname} is already in use')
+            self._offsets.append(offset)
+        self._settings.update(config)
+        self._stale = True
+        
+    def reconfigure(self, config:dict):
+        self.flush()
+        self._settings.update(config)
+        self._values_epoch = None
+        if self._request is None or self._stale:
+            return 
+        self._request.reconfigure_lines(self._settings_with_outputs())
+        
+    def _settings_with_outputs(self) -> dict:
+        # outputs keep whatever we last drove them to, across requests
+        for offset, value in self._output_values.items():
+            settings = self._settings[offset]
+            if settings.direction == Direction.OUTPUT:
+                settings.output_value = value
+        return self._settings
+        
+    def _make_request(self):
+        if self._request is not None:
+            self._stop_pump()
+            self._request.release()
+            # anything waiting is lost with the old request
+            self._events = dict()
+        self._request = gpiod.request_lines(self.chipname, consumer='microcotb', 
+                                            config=self._settings_with_outputs())
+        self._stale = False
+        self._values_epoch = None
+        if self._pumping:
+            self._start_pump()
+        
+    @property 
+    def event_pump_running(self) -> bool:
+        return self._pump is not None and self._pump.running
+    
+    def start_event_pump(self):
+        '''
+            Have edge events gathered by a background thread, from 
+            now on, rather than waited on when collecting.
+        '''
+        self._pumping = True
+        if self._request is not None and not self._stale:
+            self._start_pump()
+        # otherwise, starts along with the next request
+        
+    def stop_event_pump(self):
+        self._pumping = False
+        self._stop_pump()
+            
+    def _start_pump(self):
+        if self._pump is None:
+            self._pump = EdgeEventPump(self._request, f'{self.chipname} edge events')
+            self._pump.start()
+    
+    def _stop_pump(self):
+        if self._pump is None:
+            return 
+        self._pump.stop()
+        # keep anything it already got
+        self._sort_events(self._pump.drain())
+        self._pump = None
+        
+    def indices_of(self, offsets:list) -> list:
+        '''
+            Where each of these lines will be found in get_all_values(),
+            which never changes as lines are only ever added on
+        '''
+        return list(map(self._offsets.index, offsets))
+    
+    def get_values(self, offsets:list, indices:list=None, fresh:bool=False):
+        '''
+            Values for the lines at offsets (or, equivalently, at 
+            indices, if we have them).  Unless fresh, these may come 
+            from a read of the whole bank already done this step.
+        '''
+        if self._pending:
+            self.flush()
+        if fresh or not self.batching:
+            return self.request.get_values(offsets)
+        
+        if indices is None:
+            indices = self.indices_of(offsets)
+        epoch = SystemTime.epoch()
+        if self._values_epoch != epoch:
+            self._values = self.request.get_values(self._offsets)
+            self._values_epoch = epoch
+        return map(self._values.__getitem__, indices)
+    
+    def get_all_values(self) -> list:
+        '''
+            All the lines, fresh, in a single call, ordered as offsets
+        '''
+        if len(self._pending):
+            self.flush()
+        self._values = self.request.get_values(self._offsets)
+        self._values_epoch = SystemTime.epoch() if self.batching else None
+        return self._values
+    
+    def set_values(self, values:dict):
+        if not self.batching:
+            self.request.set_values(values)
+            self._output_values.update(values)
+            return 
+        
+        if not len(self._pending):
+            SystemTime.defer_write(self)
+        self._pending.update(values)
+        
+    def flush(self):
+        if not len(self._pending):
+            return 
+        pending = self._pending
+        self._pending = dict()
+        self.request.set_values(pending)
+        self._output_values.update(pending)
+        
+    def collect_events(self, timeout=None):
+        '''
+            Wait on and sort out any edge events, by line.
+            If the event pump is running, there's no waiting: we 
+            take whatever it has.
+        '''
+        self.flush()
+        req = self.request
+        if self._pump is not None:
+            self._sort_events(self._pump.drain())
+        elif req.wait_edge_events(timeout):
+            self._sort_events(req.read_edge_events())
+            
+    def _sort_events(self, evts):
+        for ev in evts:
+            if ev.line_offset not in self._events:
+                self._events[ev.line_offset] = []
+            self._events[ev.line_offset].append(ev)
+            
+    def take_events(self, offsets:list) -> list:
+        evts = []
+        for o in offsets:
+            if o in self._events:
+                evts += self._events.pop(o)
+        return evts
+    
+    def __repr__(self):
+        return f'<LineBank {self.chipname} ({len(self._offsets)} lines)>'
+
+
 class RPiIO(MonitorableIO):
     
     EdgeEvent = EdgeEvent
     EventType = EdgeEvent.Type
     DefaultEventWaitTimeDelta = datetime.timedelta(microseconds=DefaultDebounceUSecs+1)
-    def __init__(self, name:str, pin_list:list, chipname:str="/dev/gpiochip0"):
+    def __init__(self, name:str, pin_list:list, chipname:str="/dev/gpiochip0", bank:LineBank=None):
         width = len(pin_list)
         super().__init__(name, width, self._get_line_values, self._set_line_values)
         
@@ -46,23 +346,43 @@ class RPiIO(MonitorableIO):
         # in one set of tests I needed a 
         # resilientDebounceTries 3 or 4 to be good...
         # but it works with 0 now? wtf? well, can't complain
+        # if it comes back, port.adaptive_debounce (or the DUT's) 
+        # will work out how much is needed
         self.port.debounceUSecs = 0 
         self.port.resilientDebounceTries = 0
         
         self._chipname = chipname
         self._pin_ids = pin_list
-        self._config = dict()
         self._lineoffset_to_bitpos = {}
+        if bank is None:
+            # on our own
+            bank = LineBank(chipname)
+        self._bank = bank
         
+        config = dict()
         for i in range(width):
-            self._config[self._pin_ids[i]] = self._get_line_settings_config(int(oe_value[i]))
+            config[self._pin_ids[i]] = self._get_line_settings_config(int(oe_value[i]))
             self._lineoffset_to_bitpos[self._pin_ids[i]] = i
             
-        self._line_request = gpiod.request_lines(self._chipname, consumer='microcotb', 
-                                                 config=self._config)
-        
+        self._bank.add_lines(config)
         
+        # precomputed for reads: MSB first, so ready for packing
+        self._msb_pin_ids = list(reversed(self._pin_ids))
+        self._msb_indices = self._bank.indices_of(self._msb_pin_ids)
+        self._pack_table = pack_table(width) if width <= MaxPackTableWidth else None
+        # for writes: ByteValues to concatenate for our width, 
+        # and which of those are outputs (recomputed on oe change)
+        self._byte_shifts = list(range(0, width, 8))
+        self._out_pins = None
+        self._out_positions = None
+        self._update_output_map(self.oe.current_value())
+        # bit/slice writes only set the lines concerned
+        self.signal_set_bits = self._set_line_bits
         
+    @property 
+    def bank(self) -> LineBank:
+        return self._bank
+    
     
     @property
     def has_inputs(self):
@@ -70,32 +390,57 @@ class RPiIO(MonitorableIO):
         #    return True 
         return self.oe.current_value() < self.oe.max_value
     
-    def has_events(self, timeout=DefaultEventWaitTimeDelta):
-        if self._line_request.wait_edge_events(timeout):
-            evts = self._line_request.read_edge_events()
-            return len(evts)
-            # print(f'NUM EVENTS! {num}')
-            v = self.last_value
-            max_val = self.max_value
-            #print(f'Events!  last val {v}...', end='')
-            data = []
-            for ev in evts:
-                data.append((ev.global_seqno, ev.timestamp_ns, ev.event_type, bin(ev.line_seqno), self._lineoffset_to_bitpos[ev.line_offset]))
-                mask = (1 << self._lineoffset_to_bitpos[ev.line_offset])
-                if ev.event_type == EdgeEvent.Type.FALLING_EDGE:
-                    v &= (max_val & ~mask) # clear bit
-                elif ev.event_type == EdgeEvent.Type.RISING_EDGE:
-                    v |= mask # set bit
+    def take_edge_events(self, timeout=DefaultEventWaitTimeDelta) -> list:
+        '''
+            All the edge events on our lines, in order of occurrence.
+        '''
+        self._bank.collect_events(timeout)
+        evts = self._bank.take_events(self._pin_ids)
+        if len(evts) > 1:
+            evts.sort(key=lambda ev: (ev.timestamp_ns, ev.global_seqno))
+        return evts
+    
+    def edge_event_values(self, evts:list, known_value:int=None) -> list:
+        '''
+            Walk through edge events, as from take_edge_events(), 
+            returning a list of (timestamp_ns, port value) after each.
             
-            #print(f'now set to {v}')
-            print('\n\t'.join(list(map(lambda x: str(x), data))))
+            Lines without events keep their bit from known_value.  
+            Those with events are, before their first event, whatever 
+            that event changed them from.
+        '''
+        v = known_value if known_value is not None else 0
+        seen = 0
+        for ev in evts:
+            mask = 1 << self._lineoffset_to_bitpos[ev.line_offset]
+            if not (seen & mask):
+                seen |= mask
+                if ev.event_type == EdgeEvent.Type.RISING_EDGE:
+                    v &= ~mask
+                else:
+                    v |= mask
+        values = []
+        for ev in evts:
+            mask = 1 << self._lineoffset_to_bitpos[ev.line_offset]
+            if ev.event_type == EdgeEvent.Type.FALLING_EDGE:
+                v &= ~mask
+            else:
+                v |= mask
+            values.append((ev.timestamp_ns, v))
+        if len(values):
             self.port.do_force_update_last_value(v)
-            return evts
+        return values
+    
+    def has_events(self, timeout=DefaultEventWaitTimeDelta):
+        self._bank.collect_events(timeout)
+        evts = self._bank.take_events(self._pin_ids)
+        if len(evts):
+            return len(evts)
         return None
     
     @property 
     def line_request(self) -> gpiod.LineRequest:
-        return self._line_request
+        return self._bank.request
     
     def _get_line_settings_config(self, for_output:bool) -> gpiod.LineSettings:
         if for_output:
@@ -108,21 +453,53 @@ class RPiIO(MonitorableIO):
                             debounce_period=datetime.timedelta(microseconds=self.port.debounceUSecs))
         
     def _get_line_values(self):
-        v = 0
-        for bitV in reversed(self.line_request.get_values(self._pin_ids)):
-            v = v * 2 + bitV.value # Supposedly faster than shifting
-        return v
+        port = self.port
+        # debouncing re-reads have to actually go to the lines
+        fresh = port.resilientDebounceTries or port.debouncer.adaptive
+        return pack_values(self._bank.get_values(self._msb_pin_ids, self._msb_indices, fresh), 
+                           self._pack_table)
+    
+    def value_from_lines(self, line_values:list) -> int:
+        '''
+            Our value, from the bank's get_all_values()
+        '''
+        return pack_values(map(line_values.__getitem__, self._msb_indices), self._pack_table)
+    
+    def _update_output_map(self, oe_value:int):
+        if oe_value & self.max_value == self.max_value:
+            # all outputs, the usual case
+            self._out_pins = self._pin_ids
+            self._out_positions = None
+            return
+        positions = list(filter(lambda i: oe_value & (1 << i), range(self.width)))
+        self._out_pins = list(map(self._pin_ids.__getitem__, positions))
+        self._out_positions = positions
     
     def _set_line_values(self, set_to:int):
+        if not len(self._out_pins):
+            return 
         
-        oe_value = self.oe.value
-        set_val_conf = dict()
-        for i in range(len(oe_value)):    
-            if oe_value[i] == True:
-                set_val_conf[self._pin_ids[i]] =  Value.ACTIVE if (set_to & (1 << i)) else Value.INACTIVE
+        if len(self._byte_shifts) == 1:
+            bit_values = ByteValues[set_to & 0xff]
+        else:
+            bit_values = ()
+            for shift in self._byte_shifts:
+                bit_values += ByteValues[(set_to >> shift) & 0xff]
         
-        if len(set_val_conf):
-            self.line_request.set_values(set_val_conf)
+        if self._out_positions is not None:
+            bit_values = map(bit_values.__getitem__, self._out_positions)
+        
+        # zip stops at our width
+        self._bank.set_values(dict(zip(self._out_pins, bit_values)))
+        
+    def _set_line_bits(self, mask:int, set_to:int):
+        positions = self._out_positions if self._out_positions is not None else range(self.width)
+        positions = list(filter(lambda i: mask & (1 << i), positions))
+        if not len(positions):
+            return 
+        self._bank.set_values(dict(map(lambda i: (self._pin_ids[i], 
+                                                 Value.ACTIVE if set_to & (1 << i) else Value.INACTIVE), 
+                                       positions)))
                 
     @property 
     def pin_ids(self):
@@ -132,23 +509,22 @@ class RPiIO(MonitorableIO):
         changed = current_value ^ new_value
         if not changed:
             return
+        self._update_output_map(new_value)
         new_config = dict()
         for i in range(self.port.width):
             if changed & (1 << i):
-                new_settings = self._get_line_settings_config(new_value & (1 << i) )
-                new_config[self._pin_ids[i]] = new_settings
-            else:
-                new_config[self._pin_ids[i]] = self._config[self._pin_ids[i]]
+                new_config[self._pin_ids[i]] = self._get_line_settings_config(new_value & (1 << i) )
         
-        self.line_request.reconfigure_lines(new_config)
+        self._bank.reconfigure(new_config)
         
     
     def __setattr__(self, name:str, value):
         # these are special ports in that they have OE attributes
         # that are ports themselves... allow for the same 
         # convenince of doing port.oe = XX to set the sub-port value
-        if hasattr(self, name):
-            port = getattr(self, name)
+        # (looking in __dict__ so as not to trigger a read of 'value')
+        if name in self.__dict__:
+            port = self.__dict__[name]
             if isinstance(port, (IO, SliceWrapper)):
                 port.value = value 
                 return
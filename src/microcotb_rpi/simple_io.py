@@ -15,13 +15,13 @@ class SimpleIO(DUT):
         
     
     # override
-    def append_state_change(self, stch:StateChangeReport):
+    def append_state_change(self, stch:StateChangeReport, at_time=None):
         # this override is here to ensure we don't just
         # spend our time storing state changes in mem
         # for a user who's not caring about VCDs and 
         # won't flush them out.
         if self.write_vcd_enabled or self.always_queue_reports:
-            super().append_state_change(stch)
+            super().append_state_change(stch, at_time)
         else:
             # we are responsible for subfields in there
             self.add_subfields_to_report(stch)
@@ -1 +1,9 @@
-from .dut_sub import DUT
\ No newline at end of file
+from .dut_sub import DUT
+
+def __getattr__(name:str):
+    # the async DUT pulls in asyncio and threading, 
+    # only load it for those who want it
+    if name == 'AsyncDUT':
+        from .dut_async import DUT as AsyncDUT
+        return AsyncDUT
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,137 @@
+'''
+Created on Oct 19, 2026
+
+SUB DUT that keeps the event loop free.
+
+Same protocol, same discovery, same everything as dut_sub.DUT, but
+all incoming data is handled by the AsyncSerialStream's I/O thread
+so that, within tests, you may
+
+    # have a bunch of reads in flight, at once
+    a, b = await asyncio.gather(dut.uo_out.aread(), dut.uio_out.aread())
+    # or, equivalently, in a single request
+    a, b = await dut.aread('uo_out', 'uio_out')
+
+    await dut.ui_in.awrite(0x42)
+
+and have the monitor stream consumed in the background, using
+
+    dut.start_monitor_task()
+
+Regular (blocking) access, dut.uo_out.value etc, still works as usual.
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import asyncio
+
+import microcotb.log as logging
+from microcotb_sub.dut_sub import DUT as SyncDUT, DefaultPort
+from microcotb_sub.dut import SUBIO
+from microcotb_sub.signal_async import AsyncSerialStream, AsyncSUBSignal
+
+log = logging.getLogger(__name__)
+
+class AsyncSUBIO(SUBIO):
+
+    @property
+    def signal(self) -> AsyncSUBSignal:
+        return self._sub_signal
+
+    async def aread(self) -> int:
+        '''
+            Read straight from the bridge, without stalling the loop.
+        '''
+        v = await self.signal.aread()
+        self.port.do_force_update_last_value(v)
+        return v
+
+    async def awrite(self, v:int):
+        '''
+            Same as setting value, but yielding to the loop afterwards.
+        '''
+        self.value = v
+        await asyncio.sleep(0)
+
+
+class DUT(SyncDUT):
+    SerialStreamClass = AsyncSerialStream
+    SignalClass = AsyncSUBSignal
+    IOClass = AsyncSUBIO
+
+    def __init__(self, serial_port:str=DefaultPort,
+                 name:str='SUB',
+                 auto_discover:bool=False):
+        self._monitor_task = None
+        self._state_report_event = None
+        super().__init__(serial_port, name, auto_discover)
+        # discovery, if any, has been done: from here on in, the
+        # I/O thread owns the serial port
+        self.ser_stream.start()
+
+    @property
+    def ser_stream(self) -> AsyncSerialStream:
+        return super().ser_stream
+
+    async def aread(self, *names) -> list:
+        '''
+            Read a number of signals in a single request,
+            awaiting the replies.
+        '''
+        ios = list(map(lambda nm: getattr(self, nm), names))
+        if self.is_monitoring:
+            # values come from the state cache in this case
+            return list(map(lambda io: int(io.value), ios))
+
+        vals = await self.ser_stream.aread_signals(list(map(lambda io: io.signal, ios)))
+        for io, v in zip(ios, vals):
+            io.port.do_force_update_last_value(v)
+        return vals
+
+    async def monitor(self):
+        '''
+            Consume state change reports as they come in,
+            until cancelled.
+
+            Run as a background task, using start_monitor_task()
+        '''
+        loop = asyncio.get_running_loop()
+        self._state_report_event = asyncio.Event()
+        evt = self._state_report_event
+        self.ser_stream.on_state_report = lambda: loop.call_soon_threadsafe(evt.set)
+        try:
+            while True:
+                await evt.wait()
+                evt.clear()
+                if self.is_monitoring:
+                    self.poll_statechanges()
+        finally:
+            self.ser_stream.on_state_report = None
+            self._state_report_event = None
+
+    def start_monitor_task(self) -> asyncio.Task:
+        '''
+            Launch monitor() on the running loop (i.e. call from
+            within a test).  The task goes away when the test's loop does.
+        '''
+        if self._monitor_task is not None and not self._monitor_task.done():
+            return self._monitor_task
+        self._monitor_task = asyncio.get_running_loop().create_task(self.monitor())
+        return self._monitor_task
+
+    def stop_monitor_task(self):
+        if self._monitor_task is None:
+            return
+        if not self._monitor_task.done():
+            self._monitor_task.cancel()
+        self._monitor_task = None
+
+    def testing_unit_done(self, test):
+        self.stop_monitor_task()
+        super().testing_unit_done(test)
+
+
+def getDUT(port:str='/dev/ttyACM0', name:str='SUB'):
+    logging.basicConfig(level=logging.DEBUG)
+    dut = DUT(port, name, auto_discover=True)
+    return dut
@@ -62,6 +62,9 @@ class SUBStateChangeReport(StateChangeReport):
                 return
 
 class DUT(BaseDUT):
+    SerialStreamClass = SerialStream
+    SignalClass = SUBSignal
+    IOClass = SUBIO
     def __init__(self, serial_port:str=DefaultPort, 
                  name:str='SUB', 
                  auto_discover:bool=False):
@@ -76,7 +79,7 @@ class DUT(BaseDUT):
     @property 
     def ser_stream(self) -> SerialStream:
         if self._stream is None:
-            self._stream = SerialStream(serial.Serial(self.port, 115200*6, timeout=0.5))
+            self._stream = self.SerialStreamClass(serial.Serial(self.port, 115200*6, timeout=0.5))
         return self._stream
     @property 
     def serial(self) -> serial.Serial:
@@ -87,7 +90,7 @@ class DUT(BaseDUT):
 
         
     def add_signal(self, name, addr, width:int, is_writeable_input:bool=False):
-        s = SUBSignal(self.ser_stream, name, addr, width, is_writeable_input)
+        s = self.SignalClass(self.ser_stream, name, addr, width, is_writeable_input)
         self._added_signals[name] = s
         if width is None:
             # take a guess
@@ -131,11 +134,54 @@ class DUT(BaseDUT):
         if s.is_writeable:
             wrt = writer 
             
-        iop = SUBIO(s, name, width, reader, wrt)
+        def burst_clock(clock):
+            # bursts are a single transfer, so no state change tracking,
+            # and the clock has to be a bit on this same bridge
+            if self.is_monitoring:
+                return None
+            clk = getattr(clock, 'signal', None)
+            if not isinstance(clk, SUBSignal) or clk.width != 1:
+                return None
+            if clk.serial_stream is not self.ser_stream or not clk.is_writeable:
+                return None
+            return clk
+        
+        def sequence_writer(values:list, clock, cycles:int) -> bool:
+            clk = burst_clock(clock)
+            if clk is None:
+                return False
+            s.write_sequence(values, clk, cycles)
+            return True
+        
+        def sequence_reader(count:int, clock, cycles:int) -> list:
+            clk = burst_clock(clock)
+            if clk is None:
+                return None
+            return s.read_sequence(count, clk, cycles)
+            
+        iop = self.IOClass(s, name, width, reader, wrt)
+        iop.port.signal_read_sequence = sequence_reader
+        if s.is_writeable:
+            iop.port.signal_write_sequence = sequence_writer
         setattr(self, name, iop)
         self._signal_by_address[s.address] = iop
         
     
+    def read_all(self) -> dict:
+        if self.is_monitoring:
+            # reads are served from the state cache, in that case
+            return super().read_all()
+        
+        ios = list(filter(lambda io: io.is_readable, self._signal_by_address.values()))
+        vals = dict()
+        if not len(ios):
+            return vals
+        
+        for io, v in zip(ios, self.ser_stream.read_signals(list(map(lambda io: io.signal, ios)))):
+            io.port.do_force_update_last_value(v)
+            vals[io.name] = v
+        return vals
+    
     def testing_unit_start(self, test):
         self.poll_general(delay=0.05) # make sure we flush anything
         super().testing_unit_start(test)
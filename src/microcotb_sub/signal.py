@@ -117,6 +117,52 @@ class SerialStream:
             time.sleep(0.001)
         return self.serial.write(bts)
     
+    def read_signals(self, signals:list) -> list:
+        '''
+            Read a number of signals in a single round trip:
+            all the read commands go out in one write and 
+            the replies, one byte each, come back in order.
+        '''
+        sus = self.suspend_state_monitoring
+        delay = 0
+        if AsynchronousStateNotifs and not sus:
+            delay=PollCertainDelay # monitoring, need to slow it down to ensure we get only our values back
+        self.poll(delay=delay)
+        self.suspend_state_monitoring = True
+        self.write_out(bytearray(map(lambda s: s.read_command, signals)))
+        
+        self.poll(len(signals))
+        v = self.get_stream()
+        vals = []
+        for i in range(len(signals)):
+            if i < len(v):
+                signals[i]._current_value = v[i]
+            vals.append(signals[i]._current_value)
+            
+        self.suspend_state_monitoring = sus 
+        return vals
+        
+    def transact(self, cmd:bytearray, num_reply_bytes:int=0) -> bytearray:
+        '''
+            Send a (possibly long) string of commands out in one 
+            write and collect the num_reply_bytes they produce.
+        '''
+        sus = self.suspend_state_monitoring
+        self.poll()
+        self.suspend_state_monitoring = True
+        self.write_out(cmd)
+        v = bytearray()
+        while len(v) < num_reply_bytes:
+            self.poll(num_reply_bytes - len(v))
+            got = self.get_stream()
+            if not len(got):
+                log.warning(f'Only got {len(v)} of {num_reply_bytes} bytes back')
+                break
+            v += got
+        self.suspend_state_monitoring = sus
+        self.poll()
+        return v
+        
     def poll(self, size=None, delay:float = 0, wait_for_atleast:int=0):
         
         if delay > 0:
@@ -145,59 +191,63 @@ class SerialStream:
             if not len(v):
                 if not self.reading_state_changes:
                     raise RuntimeError('empty v from ser read??')
-            val = v[0]
+            if self.take_byte(v[0]):
+                # in a state change report, more to come
+                while not self.serial.in_waiting:
+                    time.sleep(PollShortDelay)
+                    
+    def take_byte(self, val:int) -> bool:
+        '''
+            Sort an incoming byte into the state change stream, 
+            or the general stream.
+            Returns True when we know more state change bytes are coming.
+        '''
+        if not self.reading_state_changes:
             
+            if val == ord('m'):
+                verbose_debug(f"not stat chng, but got 'm'")
+                self.state_stream.append(val)
+                self.reading_state_changes = True
+                self.state_byte = 0
+                return True
             
-            if not self.reading_state_changes:
-                
-                if val == ord('m'):
-                    verbose_debug(f"not stat chng, but got 'm'")
-                    self.state_stream += v
-                    self.reading_state_changes = True
+            verbose_debug(f"not stat chng got {val}")
+            self.stream.append(val)
+            return False
+        
+        if self.state_byte == 0 and val == 0xff:
+            verbose_debug(f"stat chng got eof")
+            self.state_stream.append(val)
+            self.reading_state_changes = False
+        elif self.state_byte == 0 and val == ord('m'):
+            verbose_debug(f"stat chng got 'm'")
+            # another m
+            self.state_stream.append(val)
+            return True
+        else:
+            verbose_debug(f"stat chng got {val} now at {self.state_byte} byte")
+            
+            if self.state_byte == 0:
+                # multibits have address 1AAAAV
+                # singlebits have address 0AAAA
+                address = val & 0b111111
+                if address <= 0b1111:
+                    # single bit, value is stashed in high bit
+                    bit_value = 1 if val & 0x80 else 0
+                    self.state_stream += bytearray([address, bit_value])
                     self.state_byte = 0
-                    while not self.serial.in_waiting:
-                        time.sleep(PollShortDelay)
                 else:
-                    verbose_debug(f"not stat chng got {v}")
-                    self.stream += v
+                    self.state_stream += bytearray([address])
+                    self.state_byte += 1
             else:
-                if self.state_byte == 0 and val == 0xff:
-                    verbose_debug(f"stat chng got eof")
-                    self.state_stream += v
-                    self.reading_state_changes = False
-                elif self.state_byte == 0 and val == ord('m'):
-                    verbose_debug(f"stat chng got 'm'")
-                    # another m
-                    self.state_stream += v
-                    while not self.serial.in_waiting:
-                        time.sleep(PollShortDelay)
-                else:
-                    verbose_debug(f"stat chng got {v} now at {self.state_byte} byte")
-                    
-                    if self.state_byte == 0:
-                        # multibits have address 1AAAAV
-                        # singlebits have address 0AAAA
-                        address = val & 0b111111
-                        if address <= 0b1111:
-                            # single bit, value is stashed in high bit
-                            bit_value = 1 if val & 0x80 else 0
-                            self.state_stream += bytearray([address, bit_value])
-                            self.state_byte = 0
-                        else:
-                            self.state_stream += bytearray([address])
-                            self.state_byte += 1
-                    else:
-                        self.state_stream += v
-                        self.state_byte += 1
-                        
-                    if self.state_byte >= 2:
-                        self.state_byte = 0
-                    #if not self.serial.in_waiting:
-                    #    time.sleep(PollShortDelay)
-
-
-
-
+                self.state_stream.append(val)
+                self.state_byte += 1
+                
+            if self.state_byte >= 2:
+                self.state_byte = 0
+            #if not self.serial.in_waiting:
+            #    time.sleep(PollShortDelay)
+        return False
 
 
 
@@ -227,7 +277,8 @@ class SUBSignal(Signal):
     def serial_stream(self) -> SerialStream:
         return self._serstream
 
-    def read(self):
+    @property 
+    def read_command(self) -> int:
         if self._base_readcmd is None:
             cmd = 1<<7 # io rw
             if self.multi_bit:
@@ -237,29 +288,13 @@ class SUBSignal(Signal):
                 
             cmd |= 1 # is a read
             self._base_readcmd = cmd
-        
-        sus = self.serial_stream.suspend_state_monitoring
-        delay = 0
-        if AsynchronousStateNotifs and not sus:
-            delay=PollCertainDelay # monitoring, need to slow it down to ensure we get only our value back
-        self.serial_stream.poll(delay=delay)
-        self.serial_stream.suspend_state_monitoring = True
-        self.serial_stream.write_out(bytearray([self._base_readcmd]))
-        
-        self.serial_stream.poll(1)
-        v = self.serial_stream.get_stream()
-        if len(v):
-            self._current_value = int.from_bytes(v, 'big')
-            
-        self.serial_stream.suspend_state_monitoring = sus 
-        return self._current_value
+        return self._base_readcmd
     
+    def read(self):
+        return self.serial_stream.read_signals([self])[0]
     
-    def write(self, val:int):
-        if self._written_to and val == self._current_value:
-            return 
-        
-        self._written_to = True
+    
+    def write_command(self, val:int) -> bytearray:
         if self._base_writecmd is None:
             cmd = 1<<7 # io rw
             if self.multi_bit:
@@ -269,12 +304,19 @@ class SUBSignal(Signal):
             self._base_writecmd = cmd
         
         if self.multi_bit:
-            send_bytes = bytearray([self._base_writecmd, val])
-        else:
-            cmd = self._base_writecmd
-            if val:
-                cmd |= 1<<1
-            send_bytes = bytearray([cmd])
+            return bytearray([self._base_writecmd, val])
+        
+        cmd = self._base_writecmd
+        if val:
+            cmd |= 1<<1
+        return bytearray([cmd])
+    
+    def write(self, val:int):
+        if self._written_to and val == self._current_value:
+            return 
+        
+        self._written_to = True
+        send_bytes = self.write_command(val)
 
         self._current_value = val
         while self.serial_stream.serial.out_waiting:
@@ -288,5 +330,44 @@ class SUBSignal(Signal):
         self.serial_stream.suspend_state_monitoring = sus
         self.serial_stream.poll()
         
+    def _clocking_commands(self, clock:'SUBSignal', cycles:int) -> bytearray:
+        return (clock.write_command(1) + clock.write_command(0))*cycles
+    
+    def _clocked_burst_done(self, clock:'SUBSignal'):
+        clock._current_value = 0
+        clock._written_to = True
+    
+    def write_sequence(self, values:list, clock:'SUBSignal', cycles:int=1):
+        '''
+            Write each of values in turn, toggling the (single bit) 
+            clock cycles times after each, all in a single transfer.
+        '''
+        toggles = self._clocking_commands(clock, cycles)
+        send_bytes = bytearray()
+        for v in values:
+            send_bytes += self.write_command(v)
+            send_bytes += toggles
+        self.serial_stream.transact(send_bytes)
+        self._current_value = values[-1]
+        self._written_to = True
+        self._clocked_burst_done(clock)
+        
+    def read_sequence(self, count:int, clock:'SUBSignal', cycles:int=1) -> list:
+        '''
+            Read count values, toggling the clock cycles times 
+            after each, all in a single transfer.
+            
+            Raises RuntimeError if the reply comes back short: the 
+            clocking has happened by then, so there's no going back.
+        '''
+        send_bytes = (bytearray([self.read_command]) + self._clocking_commands(clock, cycles))*count
+        vals = list(self.serial_stream.transact(send_bytes, count))
+        self._clocked_burst_done(clock)
+        if len(vals):
+            self._current_value = vals[-1]
+        if len(vals) < count:
+            raise RuntimeError(f'read_sequence on {self.name}: got {len(vals)} of {count} values')
+        return vals
+        
     def __repr__(self):
         return f'<SUBSignal {self.name}>'
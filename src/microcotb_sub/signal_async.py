@@ -0,0 +1,255 @@
+'''
+Created on Oct 19, 2026
+
+An asyncio-friendly take on the SUB serial stream.
+
+A dedicated I/O thread owns the serial port: it sorts everything that
+comes in, handing replies to whoever asked for them (in order, as the
+bridge answers in order) and feeding state change reports to the
+state stream, as they arrive.
+
+Requests are tracked with futures, so the same machinery serves
+  * blocking calls, which just wait on the result; and
+  * coroutines, which await it without stalling the event loop,
+    meaning many requests can be in flight at once.
+
+@author: Pat Deegan
+@copyright: Copyright (C) 2026 Pat Deegan, https://psychogenic.com
+'''
+import time
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+import serial
+import microcotb.log as logging
+from microcotb_sub.signal import SerialStream, SUBSignal
+
+log = logging.getLogger(__name__)
+
+ReplyTimeout = 0.5
+PumpReadTimeout = 0.01
+
+class PendingRequest:
+    '''
+        Something we've sent out and for which we expect
+        num_bytes of reply.
+    '''
+    def __init__(self, num_bytes:int):
+        self.num_bytes = num_bytes
+        self.data = bytearray()
+        self.future = Future()
+
+    @property
+    def complete(self) -> bool:
+        return len(self.data) >= self.num_bytes
+
+    def __repr__(self):
+        return f'<PendingRequest {len(self.data)}/{self.num_bytes}>'
+
+
+class AsyncSerialStream(SerialStream):
+    '''
+        Drop-in for the SerialStream that, once start()ed,
+        does all its reading from a background thread.
+
+        Until started, it behaves exactly like its parent.
+    '''
+    def __init__(self, serport:serial.Serial):
+        super().__init__(serport)
+        self._lock = threading.Lock()
+        self._pending = deque()
+        self._pump = None
+        self._running = False
+        self._reader_error = None
+        self.state_report_received = threading.Event()
+        self.on_state_report = None # callback, called from I/O thread
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def requests_in_flight(self) -> int:
+        return len(self._pending)
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._pump = threading.Thread(target=self._pump_loop, name='SUBStream', daemon=True)
+        self._pump.start()
+
+    def stop(self):
+        if not self._running:
+            return
+        self._running = False
+        self._pump.join()
+        self._pump = None
+
+    def submit(self, cmd:bytearray, num_reply_bytes:int=0) -> PendingRequest:
+        '''
+            Send cmd out, expecting num_reply_bytes back.
+            Returns the request, whose future will hold the reply.
+        '''
+        req = PendingRequest(num_reply_bytes)
+        if self._reader_error is not None:
+            req.future.set_exception(self._reader_error)
+            return req
+
+        with self._lock:
+            # ordering of the pending queue must match the order in which
+            # commands hit the wire, hence doing this under the lock
+            if num_reply_bytes:
+                self._pending.append(req)
+            self.serial.write(cmd)
+
+        if not num_reply_bytes:
+            req.future.set_result(req.data)
+        return req
+
+    def wait_for(self, req:PendingRequest, timeout:float=ReplyTimeout) -> bytearray:
+        try:
+            return req.future.result(timeout)
+        except FutureTimeout:
+            return self._abandon(req)
+
+    async def await_for(self, req:PendingRequest, timeout:float=ReplyTimeout) -> bytearray:
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(req.future), timeout)
+        except asyncio.TimeoutError:
+            return self._abandon(req)
+
+    def _abandon(self, req:PendingRequest) -> bytearray:
+        # the request stays queued: whenever its reply does show up, 
+        # those bytes are its own and mustn't go to whoever is next
+        log.warning(f'Timed out waiting on {req}')
+        with self._lock:
+            return bytearray(req.data)
+
+    def _apply_replies(self, signals:list, v:bytearray) -> list:
+        vals = []
+        for i in range(len(signals)):
+            if i < len(v):
+                signals[i]._current_value = v[i]
+            vals.append(signals[i]._current_value)
+        return vals
+
+    def read_signals(self, signals:list) -> list:
+        if not self._running:
+            return super().read_signals(signals)
+        req = self.submit(bytearray(map(lambda s: s.read_command, signals)), len(signals))
+        return self._apply_replies(signals, self.wait_for(req))
+
+    async def aread_signals(self, signals:list) -> list:
+        '''
+            Awaitable read_signals().  Nothing blocks, so any number
+            of these may be outstanding at once.
+        '''
+        if not self._running:
+            return self.read_signals(signals)
+        req = self.submit(bytearray(map(lambda s: s.read_command, signals)), len(signals))
+        return self._apply_replies(signals, await self.await_for(req))
+
+    def transact(self, cmd:bytearray, num_reply_bytes:int=0) -> bytearray:
+        if not self._running:
+            return super().transact(cmd, num_reply_bytes)
+        return self.wait_for(self.submit(cmd, num_reply_bytes))
+
+    def write_out(self, bts:bytearray):
+        if not self._running:
+            return super().write_out(bts)
+        self.submit(bts)
+        return len(bts)
+
+    def get_stream(self):
+        with self._lock:
+            return super().get_stream()
+
+    def get_state_stream(self):
+        with self._lock:
+            self.state_report_received.clear()
+            return super().get_state_stream()
+
+    def poll(self, size=None, delay:float = 0, wait_for_atleast:int=0):
+        if not self._running:
+            return super().poll(size, delay, wait_for_atleast)
+
+        # the I/O thread is doing all the reading, all we
+        # need to do here is give it a chance
+        if delay > 0:
+            time.sleep(delay)
+
+        if wait_for_atleast:
+            self.state_report_received.wait(ReplyTimeout)
+
+        if size is not None:
+            tstart = time.monotonic()
+            while self.stream_size < size and (time.monotonic() - tstart) < ReplyTimeout:
+                time.sleep(0.001)
+
+    def _take_incoming(self, val:int):
+        if not self.reading_state_changes:
+            if len(self._pending):
+                req = self._pending[0]
+                req.data.append(val)
+                if req.complete:
+                    self._pending.popleft()
+                    # abandoned (or cancelled, by an awaiter) requests are done already
+                    if not req.future.done():
+                        req.future.set_result(req.data)
+                return
+            if self.suspend_state_monitoring:
+                self.stream.append(val)
+                return
+
+        was_reading = self.reading_state_changes
+        self.take_byte(val)
+        if was_reading and not self.reading_state_changes:
+            self.state_report_received.set()
+            if self.on_state_report is not None:
+                self.on_state_report()
+
+    def _pump_loop(self):
+        self.serial.timeout = PumpReadTimeout
+        while self._running:
+            try:
+                v = self.serial.read(max(1, self.serial.in_waiting))
+            except Exception as e:
+                log.error(f'SUB stream read failed: {e}')
+                self._fail_pending(e)
+                break
+
+            if not len(v):
+                continue
+            with self._lock:
+                for val in v:
+                    self._take_incoming(val)
+        self._running = False
+
+    def _fail_pending(self, e:Exception):
+        with self._lock:
+            self._reader_error = e
+            while len(self._pending):
+                fut = self._pending.popleft().future
+                if not fut.done():
+                    fut.set_exception(e)
+
+
+class AsyncSUBSignal(SUBSignal):
+    '''
+        A SUBSignal that may also be awaited upon.
+    '''
+    @property
+    def serial_stream(self) -> AsyncSerialStream:
+        return self._serstream
+
+    async def aread(self) -> int:
+        return (await self.serial_stream.aread_signals([self]))[0]
+
+    async def awrite(self, val:int):
+        # writes never wait on a reply, the point of awaiting
+        # is simply to let others have a go
+        self.write(val)
+        await asyncio.sleep(0)
+